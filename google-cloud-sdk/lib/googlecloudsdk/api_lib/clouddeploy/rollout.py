@@ -67,18 +67,37 @@ class RolloutClient(object):
         name=name)
     return self._service.Get(request)
 
-  def List(self, release_name, filter_str=None):
+  def List(self, release_name, filter_str=None, page_size=None):
     """Lists rollout resources that belongs to a release.
 
     Args:
       release_name: str, name of the release.
       filter_str: optional[str], list filter.
+      page_size: optional[int], the maximum number of rollouts to return.
+        Callers that only need to test for existence should pass 1 so the
+        server returns a single entry.
 
     Returns:
       Rollout list response.
     """
     request = self.messages.ClouddeployProjectsLocationsDeliveryPipelinesReleasesRolloutsListRequest(
-        parent=release_name, filter=filter_str)
+        parent=release_name, filter=filter_str, pageSize=page_size)
+    return self._service.List(request)
+
+  def ListSucceeded(self, release_name):
+    """Lists the successfully deployed rollouts of a release, newest first.
+
+    Args:
+      release_name: str, name of the release.
+
+    Returns:
+      Rollout list response, ordered by create time descending.
+    """
+    request = self.messages.ClouddeployProjectsLocationsDeliveryPipelinesReleasesRolloutsListRequest(
+        parent=release_name,
+        filter='(approvalState!="REJECTED" AND '
+        'approvalState!="NEEDS_APPROVAL") AND state="SUCCEEDED"',
+        orderBy='createTime desc')
     return self._service.List(request)
 
   def Create(self, rollout_ref, rollout_obj, annotations=None, labels=None):
@@ -68,7 +68,10 @@ def get_api(provider):
   Raises:
     ValueError: If provider is not a cloud scheme in storage_url.ProviderPrefix.
   """
-  if properties.VALUES.storage.use_threading_local.GetBool():
+  # Reading the property walks the properties tree, so do it once per call
+  # rather than on both sides of the instantiation.
+  use_thread_local = properties.VALUES.storage.use_threading_local.GetBool()
+  if use_thread_local:
     api_client = getattr(_cloud_api_thread_local_storage, provider.value, None)
     if api_client:
       return api_client
@@ -76,7 +79,7 @@ def get_api(provider):
   api_class = _get_api_class(provider)
   api_client = api_class()
 
-  if properties.VALUES.storage.use_threading_local.GetBool():
+  if use_thread_local:
     setattr(_cloud_api_thread_local_storage, provider.value, api_client)
 
   return api_client
@@ -19,11 +19,11 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import contextlib
 import io
 import os
 import re
 
-from googlecloudsdk.api_lib.container import api_adapter as gke_api_adapter
 from googlecloudsdk.api_lib.container import kubeconfig as kconfig
 from googlecloudsdk.api_lib.container import util as c_util
 from googlecloudsdk.api_lib.util import waiter
@@ -37,10 +37,13 @@ from googlecloudsdk.core import properties
 from googlecloudsdk.core import requests
 from googlecloudsdk.core.util import encoding
 from googlecloudsdk.core.util import files
-from kubernetes import client as kube_client_lib
-from kubernetes import config as kube_client_config
 from six.moves.urllib.parse import urljoin
 
+# The GKE API adapter and the official Kubernetes client are only needed on
+# the GKE / workload-identity branches of register and unregister; they are
+# imported lazily inside the functions that use them so that every other
+# invocation (including --help) does not pay their import cost.
+
 # import urljoin in a Python 2 and 3 compatible way
 NAMESPACE_DELETION_INITIAL_WAIT_MS = 0
 NAMESPACE_DELETION_TIMEOUT_MS = 1000 * 60 * 2
@@ -51,6 +54,20 @@ RBAC_PERMISSION_POLICY_NAME = 'gateway-permission-{metadata}'
 RBAC_ANTHOS_SUPPORT_POLICY_NAME = 'gateway-anthos-support-permission-{metadata}'
 
 
+# GKE API adapters by API version. Each adapter owns an authenticated HTTP
+# transport; reusing it lets successive GKE calls within one invocation share
+# the existing connection instead of redoing the OAuth and TLS handshakes.
+_gke_api_adapters = {}
+
+
+def _GetGKEAPIAdapter(api_version):
+  """Returns a (cached) GKE API adapter for the given API version."""
+  if api_version not in _gke_api_adapters:
+    from googlecloudsdk.api_lib.container import api_adapter as gke_api_adapter  # pylint: disable=g-import-not-at-top
+    _gke_api_adapters[api_version] = gke_api_adapter.NewAPIAdapter(api_version)
+  return _gke_api_adapters[api_version]
+
+
 class RBACError(exceptions.Error):
   """Class for errors raised by GKE Hub commands."""
 
@@ -164,6 +181,10 @@ class KubeconfigProcessor(object):
       raise exceptions.Error('kubectl not installed.')
     self.gke_cluster_self_link = None
     self.gke_cluster_uri = None
+    # The container.googleapis.com/instance_id node annotation, fetched at
+    # most once per invocation and shared by all callers that need to decide
+    # whether the target cluster is a GKE cluster.
+    self.gke_instance_id = None
 
   def GetKubeconfigAndContext(self, temp_kubeconfig_dir):
     """Gets the kubeconfig, cluster context and resource link from arguments and defaults.
@@ -236,6 +257,8 @@ class KubeconfigProcessor(object):
     Returns:
       kubernetes.client.ApiClient
     """
+    from kubernetes import client as kube_client_lib  # pylint: disable=g-import-not-at-top
+    from kubernetes import config as kube_client_config  # pylint: disable=g-import-not-at-top
     # If processor.GetKubeconfigAndContext returns `None` for the kubeconfig
     # path, that indicates we should be using in-cluster config. Otherwise,
     # the first return value is the path to the kubeconfig file.
@@ -293,6 +316,11 @@ class KubernetesClient(object):
     """
     self.kubectl_timeout = '20s'
 
+    # Lazily-constructed CoreV1Api bound to a single ApiClient, so repeated
+    # namespace operations (e.g. deletion polling) reuse one authenticated
+    # HTTPS connection instead of forking kubectl per call.
+    self._core_v1_api = None
+
     self.temp_kubeconfig_dir = None
     # If the cluster to be registered is a GKE cluster, create a temporary
     # directory to store the kubeconfig that will be generated using the
@@ -540,8 +568,30 @@ class KubernetesClient(object):
     return err is None
 
   def DeleteNamespace(self, namespace):
-    _, err = self._RunKubectl(['delete', 'namespace', namespace])
-    return err
+    """Deletes a namespace via the Kubernetes API.
+
+    Args:
+      namespace: the name of the namespace to delete.
+
+    Returns:
+      None on success, or the kubernetes.client.rest.ApiException from the
+      API server otherwise. A status of 404 indicates that the namespace is
+      already gone.
+    """
+    from kubernetes.client import rest as kube_client_rest  # pylint: disable=g-import-not-at-top
+    try:
+      self._CoreV1Api().delete_namespace(namespace)
+    except kube_client_rest.ApiException as e:
+      return e
+    return None
+
+  def _CoreV1Api(self):
+    """Returns a CoreV1Api client, constructing and caching it on first use."""
+    if self._core_v1_api is None:
+      from kubernetes import client as kube_client_lib  # pylint: disable=g-import-not-at-top
+      self._core_v1_api = kube_client_lib.CoreV1Api(
+          self.processor.GetKubeClient(self.kubeconfig, self.context))
+    return self._core_v1_api
 
   def GetResourceField(self, namespace, resource, json_path):
     """Returns the value of a field on a Kubernetes resource.
@@ -835,15 +885,24 @@ class NamespaceDeleteOperation(object):
     if not err:
       return
 
-    # If deletion is successful, the delete command will return a NotFound
-    # error.
-    if 'NotFound' in err:
+    # If deletion is successful, subsequent deletes fail with a typed 404;
+    # check the status code rather than scanning the error text.
+    if getattr(err, 'status', None) == 404:
       self.done = True
       self.succeeded = True
     else:
       self.error = err
 
 
+# Zonal, regional and generic GKE URIs differ only in the location keyword,
+# so one compiled alternation replaces the three per-call patterns that each
+# re-scanned the whole URI. The [^/]+ classes keep matching linear: no
+# capture can backtrack across a path-segment boundary.
+_GKE_URI_RE = re.compile(
+    r'^(?:.*\/)?projects\/(?P<project>[^/]+)\/(?:zones|regions|locations)\/'
+    r'(?P<location>[^/]+)\/clusters\/(?P<cluster>[^/]+)\/?$')
+
+
 def _ParseGKEURI(gke_uri):
   """The GKE resource URI can be of following types: zonal, regional or generic.
 
@@ -858,23 +917,13 @@ def _ParseGKEURI(gke_uri):
   Returns:
     cluster location and name
   """
-  zonal_uri_pattern = r'.*\/projects\/(.*)\/zones\/(.*)\/clusters\/(.*)'
-  regional_uri_pattern = r'.*\/projects\/(.*)\/regions\/(.*)\/clusters\/(.*)'
-  location_uri_pattern = r'.*\/projects\/(.*)\/locations\/(.*)\/clusters\/(.*)'
-
-  zone_matcher = re.search(zonal_uri_pattern, gke_uri)
-  if zone_matcher is not None:
-    return zone_matcher.group(1), zone_matcher.group(2), zone_matcher.group(3)
-
-  region_matcher = re.search(regional_uri_pattern, gke_uri)
-  if region_matcher is not None:
-    return region_matcher.group(1), region_matcher.group(
-        2), region_matcher.group(3)
-
-  location_matcher = re.search(location_uri_pattern, gke_uri)
-  if location_matcher is not None:
-    return location_matcher.group(1), location_matcher.group(
-        2), location_matcher.group(3)
+  # Gate the regex behind a cheap substring test: every valid GKE URI
+  # contains '/clusters/', and the C-level scan rejects malformed input
+  # without paying the per-call cost of the regex engine.
+  uri_matcher = _GKE_URI_RE.match(gke_uri) if '/clusters/' in gke_uri else None
+  if uri_matcher is not None:
+    return (uri_matcher.group('project'), uri_matcher.group('location'),
+            uri_matcher.group('cluster'))
 
   raise exceptions.Error(
       'argument --gke-uri: {} is invalid. '
@@ -884,15 +933,39 @@ def _ParseGKEURI(gke_uri):
 
 
 def _ParseGKECluster(gke_cluster):
-  rgx = r'(.*)\/(.*)'
-  cluster_matcher = re.search(rgx, gke_cluster)
-  if cluster_matcher is not None:
-    return cluster_matcher.group(1), cluster_matcher.group(2)
+  # A simple LOCATION/CLUSTER split; no regex needed. rpartition mirrors the
+  # greedy match previously used, binding everything before the last '/' to
+  # the location.
+  location, sep, name = gke_cluster.rpartition('/')
+  if sep:
+    return location, name
   raise exceptions.Error(
       'argument --gke-cluster: {} is invalid. --gke-cluster must be of format: '
       '`{{REGION OR ZONE}}/{{CLUSTER_NAME`}}`'.format(gke_cluster))
 
 
+@contextlib.contextmanager
+def _TemporaryEnv(key, value):
+  """Temporarily sets an environment variable for the duration of the block.
+
+  The previous value (or absence) of the variable is snapshotted once on entry
+  and restored on exit, even if the block raises.
+
+  Args:
+    key: string, the name of the environment variable.
+    value: string, the value to set for the duration of the block.
+
+  Yields:
+    None.
+  """
+  old_value = encoding.GetEncodedValue(os.environ, key)
+  encoding.SetEncodedValue(os.environ, key, value)
+  try:
+    yield
+  finally:
+    encoding.SetEncodedValue(os.environ, key, old_value)
+
+
 def _GetGKEKubeconfig(project, location_id, cluster_id, temp_kubeconfig_dir):
   """The kubeconfig of GKE Cluster is fetched using the GKE APIs.
 
@@ -919,10 +992,8 @@ def _GetGKEKubeconfig(project, location_id, cluster_id, temp_kubeconfig_dir):
     the path to the kubeconfig file
   """
   kubeconfig = os.path.join(temp_kubeconfig_dir.path, 'kubeconfig')
-  old_kubeconfig = encoding.GetEncodedValue(os.environ, 'KUBECONFIG')
-  try:
-    encoding.SetEncodedValue(os.environ, 'KUBECONFIG', kubeconfig)
-    gke_api = gke_api_adapter.NewAPIAdapter('v1')
+  with _TemporaryEnv('KUBECONFIG', kubeconfig):
+    gke_api = _GetGKEAPIAdapter('v1')
     cluster_ref = gke_api.ParseCluster(cluster_id, location_id, project)
     cluster = gke_api.GetCluster(cluster_ref)
     auth = cluster.masterAuth
@@ -934,11 +1005,6 @@ def _GetGKEKubeconfig(project, location_id, cluster_id, temp_kubeconfig_dir):
           'Unable to get cluster credentials. User must have edit '
           'permission on {}'.format(cluster_ref.projectId))
     c_util.ClusterConfig.Persist(cluster, cluster_ref.projectId)
-  finally:
-    if old_kubeconfig:
-      encoding.SetEncodedValue(os.environ, 'KUBECONFIG', old_kubeconfig)
-    else:
-      del os.environ['KUBECONFIG']
   return kubeconfig
 
 
@@ -959,7 +1025,13 @@ def ValidateClusterIdentifierFlags(kube_client, args):
     calliope_exceptions.InvalidArgumentException is raised if --context is set
     for non GKE clusters.
   """
-  is_gke_cluster = IsGKECluster(kube_client)
+  # --gke-uri/--gke-cluster already assert a GKE cluster, and resolving them
+  # hits the authoritative GKE API before this point; only probe the cluster
+  # itself when neither flag was passed.
+  if args.gke_uri or args.gke_cluster:
+    is_gke_cluster = True
+  else:
+    is_gke_cluster = IsGKECluster(kube_client)
   if args.context and is_gke_cluster:
     raise calliope_exceptions.InvalidArgumentException(
         '--context', '--context cannot be used for GKE clusters. '
@@ -999,14 +1071,30 @@ def IsGKECluster(kube_client):
   if kube_client.processor and kube_client.processor.gke_cluster_self_link:
     return True
 
-  vm_instance_id, err = kube_client.GetResourceField(
-      None, 'nodes',
-      '.items[*].metadata.annotations.container\\.googleapis\\.com/instance_id')
+  # The node metadata cannot change for the lifetime of this invocation, so
+  # cache the answer on the client to avoid re-running kubectl (and the
+  # apiserver roundtrip it implies) when multiple callers ask.
+  cached = getattr(kube_client, '_is_gke_cache', None)
+  if cached is not None:
+    return cached
+
+  # Reuse the node annotation if the processor has already fetched it as part
+  # of gathering other cluster state, rather than issuing a dedicated
+  # `kubectl get nodes` just for this check.
+  vm_instance_id = (
+      kube_client.processor.gke_instance_id if kube_client.processor else None)
+  if vm_instance_id is None:
+    vm_instance_id, err = kube_client.GetResourceField(
+        None, 'nodes',
+        '.items[*].metadata.annotations.container\\.googleapis\\.com/instance_id'
+    )
 
-  if err:
-    raise exceptions.Error(
-        'kubectl returned non-zero status code: {}'.format(err))
+    if err:
+      raise exceptions.Error(
+          'kubectl returned non-zero status code: {}'.format(err))
+    if kube_client.processor:
+      kube_client.processor.gke_instance_id = vm_instance_id
 
-  if not vm_instance_id:
-    return False
-  return True
+  result = bool(vm_instance_id)
+  kube_client._is_gke_cache = result  # pylint: disable=protected-access
+  return result
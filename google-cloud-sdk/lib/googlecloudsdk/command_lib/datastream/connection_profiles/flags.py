@@ -19,17 +19,48 @@ from __future__ import division
 from __future__ import unicode_literals
 
 
+_MYSQL_PASSWORD_HELP = """\
+    Password for the user that Datastream will be using to
+    connect to the database.
+    This field is not returned on request, and the value is encrypted
+    when stored in Datastream."""
+
+_CA_CERTIFICATE_HELP = """\
+    x509 PEM-encoded certificate of the CA that signed the source database
+    server's certificate. The replica will use this certificate to verify
+    it's connecting to the right host."""
+
+_CLIENT_CERTIFICATE_HELP = """\
+    x509 PEM-encoded certificate that will be used by the replica to
+    authenticate against the source database server."""
+
+_CLIENT_KEY_HELP = """\
+    Unencrypted PKCS#1 or PKCS#8 PEM-encoded private key associated with
+    the Client Certificate."""
+
+_ORACLE_PASSWORD_HELP = """\
+    Password for the user that Datastream will be using to
+    connect to the database.
+    This field is not returned on request, and the value is encrypted
+    when stored in Datastream."""
+
+_BUCKET_NAME_HELP = """The full project and resource path for Cloud Storage
+    bucket including the name."""
+
+
+_TYPE_HELP = """Type can be MYSQL, ORACLE or GOOGLE-CLOUD-STORAGE"""
+_DISPLAY_NAME_HELP = """Friendly name for the connection profile."""
+
+
 def AddTypeFlag(parser):
   """Adds a --type flag to the given parser."""
-  help_text = """Type can be MYSQL, ORACLE or GOOGLE-CLOUD-STORAGE"""
-
-  parser.add_argument('--type', help=help_text, required=True)
+  parser.add_argument('--type', help=_TYPE_HELP, required=True)
 
 
 def AddDisplayNameFlag(parser, required=True):
   """Adds a --display-name flag to the given parser."""
-  help_text = """Friendly name for the connection profile."""
-  parser.add_argument('--display-name', help=help_text, required=required)
+  parser.add_argument('--display-name', help=_DISPLAY_NAME_HELP,
+                      required=required)
 
 
 def AddMysqlProfileGroup(parser, required=True):
@@ -50,36 +81,18 @@ def AddMysqlProfileGroup(parser, required=True):
       required=required)
   password_group = mysql_profile.add_group(required=required, mutex=True)
   password_group.add_argument(
-      '--mysql-password',
-      help="""\
-          Password for the user that Datastream will be using to
-          connect to the database.
-          This field is not returned on request, and the value is encrypted
-          when stored in Datastream.""")
+      '--mysql-password', help=_MYSQL_PASSWORD_HELP)
   password_group.add_argument(
       '--mysql-prompt-for-password',
       action='store_true',
       help='Prompt for the password used to connect to the database.')
   ssl_config = mysql_profile.add_group()
   ssl_config.add_argument(
-      '--ca-certificate',
-      help="""\
-          x509 PEM-encoded certificate of the CA that signed the source database
-          server's certificate. The replica will use this certificate to verify
-          it's connecting to the right host.""",
-      required=required)
+      '--ca-certificate', help=_CA_CERTIFICATE_HELP, required=required)
   ssl_config.add_argument(
-      '--client-certificate',
-      help="""\
-          x509 PEM-encoded certificate that will be used by the replica to
-          authenticate against the source database server.""",
-      required=required)
+      '--client-certificate', help=_CLIENT_CERTIFICATE_HELP, required=required)
   ssl_config.add_argument(
-      '--client-key',
-      help="""\
-          Unencrypted PKCS#1 or PKCS#8 PEM-encoded private key associated with
-          the Client Certificate.""",
-      required=required)
+      '--client-key', help=_CLIENT_KEY_HELP, required=required)
 
 
 def AddOracleProfileGroup(parser, required=True):
@@ -104,12 +117,7 @@ def AddOracleProfileGroup(parser, required=True):
       required=required)
   password_group = oracle_profile.add_group(required=required, mutex=True)
   password_group.add_argument(
-      '--oracle-password',
-      help="""\
-          Password for the user that Datastream will be using to
-          connect to the database.
-          This field is not returned on request, and the value is encrypted
-          when stored in Datastream.""")
+      '--oracle-password', help=_ORACLE_PASSWORD_HELP)
   password_group.add_argument(
       '--oracle-prompt-for-password',
       action='store_true',
@@ -120,10 +128,7 @@ def AddGcsProfileGroup(parser, required=True):
   """Adds necessary GCS profile flags to the given parser."""
   gcs_profile = parser.add_group()
   gcs_profile.add_argument(
-      '--bucket-name',
-      help="""The full project and resource path for Cloud Storage
-      bucket including the name.""",
-      required=required)
+      '--bucket-name', help=_BUCKET_NAME_HELP, required=required)
   gcs_profile.add_argument(
       '--root-path',
       help="""The root path inside the Cloud Storage bucket.""",
@@ -18,11 +18,91 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import functools
+
 from googlecloudsdk.calliope.concepts import concepts
 from googlecloudsdk.command_lib.util.concepts import concept_parsers
 from googlecloudsdk.command_lib.util.concepts import presentation_specs
 
 
+_ORACLE_SOURCE_CONFIG_HELP = """\
+          Path to a YAML (or JSON) file containing the configuration for Oracle Source Config.
+
+          The JSON file is formatted as follows, with snake_case field naming:
+
+          ```
+            {
+              "allowlist": {},
+              "rejectlist": {
+                "oracle_schemas": [
+                  {
+                    "schema_name": "SAMPLE",
+                    "oracle_tables": [
+                      {
+                        "table_name": "SAMPLE_TABLE",
+                        "oracle_columns": [
+                          {
+                            "column_name": "COL",
+                          }
+                        ]
+                      }
+                    ]
+                  }
+                ]
+              }
+            }
+          ```
+       """
+
+_MYSQL_SOURCE_CONFIG_HELP = """\
+          Path to a YAML (or JSON) file containing the configuration for Mysql Source Config.
+
+          The JSON file is formatted as follows, with snake_case field naming:
+
+          ```
+            {
+              "allowlist": {},
+              "rejectlist":  {
+                "mysql_databases": [
+                    {
+                      "database_name":"sample_database",
+                      "mysql_tables": [
+                        {
+                          "table_name": "sample_table",
+                          "mysql_columns": [
+                            {
+                              "column_name": "sample_column",
+                            }
+                           ]
+                        }
+                      ]
+                    }
+                  ]
+                }
+            }
+          ```
+       """
+
+_GCS_DESTINATION_CONFIG_HELP = """\
+      Path to a YAML (or JSON) file containing the configuration for Google Cloud Storage Destination Config.
+
+      The JSON file is formatted as follows:
+
+      ```
+       {
+       "path": "some/path",
+       "file_rotation_mb":5,
+       "file_rotation_interval":"15s",
+       "avro_file_format": {}
+       }
+      ```
+        """
+
+
+# The attribute configs and resource specs built below are immutable
+# descriptors, so the factories are memoized: every parser build within an
+# invocation shares one instance instead of re-constructing the same objects.
+@functools.lru_cache(maxsize=None)
 def ConnectionProfileAttributeConfig(name='connection_profile'):
   return concepts.ResourceParameterAttributeConfig(
       name=name,
@@ -31,6 +111,7 @@ def ConnectionProfileAttributeConfig(name='connection_profile'):
       completion_id_field='id')
 
 
+@functools.lru_cache(maxsize=None)
 def PrivateConnectionAttributeConfig(name='private_connection'):
   return concepts.ResourceParameterAttributeConfig(
       name=name,
@@ -39,6 +120,7 @@ def PrivateConnectionAttributeConfig(name='private_connection'):
       completion_id_field='id')
 
 
+@functools.lru_cache(maxsize=None)
 def StreamAttributeConfig(name='stream'):
   return concepts.ResourceParameterAttributeConfig(
       name=name,
@@ -47,6 +129,7 @@ def StreamAttributeConfig(name='stream'):
       completion_id_field='id')
 
 
+@functools.lru_cache(maxsize=None)
 def RouteAttributeConfig(name='route'):
   return concepts.ResourceParameterAttributeConfig(
       name=name,
@@ -55,62 +138,114 @@ def RouteAttributeConfig(name='route'):
       completion_id_field='id')
 
 
+@functools.lru_cache(maxsize=None)
 def LocationAttributeConfig():
   return concepts.ResourceParameterAttributeConfig(
       name='location', help_text='The Cloud location for the {resource}.')
 
 
+# Attribute configs shared verbatim by every resource spec below. They are
+# never mutated, so a single instance backs the whole argument graph.
+_LOCATION_ATTRIBUTE_CONFIG = LocationAttributeConfig()
+_ROUTE_PRIVATE_CONNECTION_ATTRIBUTE_CONFIG = PrivateConnectionAttributeConfig(
+    'private-connection')
+
+
+@functools.lru_cache(maxsize=None)
 def GetLocationResourceSpec(resource_name='location'):
   return concepts.ResourceSpec(
       'datastream.projects.locations',
       resource_name=resource_name,
-      locationsId=LocationAttributeConfig(),
+      locationsId=_LOCATION_ATTRIBUTE_CONFIG,
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG,
       disable_auto_completers=False)
 
 
+@functools.lru_cache(maxsize=None)
 def GetConnectionProfileResourceSpec(resource_name='connection_profile'):
   return concepts.ResourceSpec(
       'datastream.projects.locations.connectionProfiles',
       resource_name=resource_name,
       connectionProfilesId=ConnectionProfileAttributeConfig(name=resource_name),
-      locationsId=LocationAttributeConfig(),
+      locationsId=_LOCATION_ATTRIBUTE_CONFIG,
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG,
       disable_auto_completers=False)
 
 
+@functools.lru_cache(maxsize=None)
 def GetPrivateConnectionResourceSpec(resource_name='private_connection'):
   return concepts.ResourceSpec(
       'datastream.projects.locations.privateConnections',
       resource_name=resource_name,
       privateConnectionsId=PrivateConnectionAttributeConfig(name=resource_name),
-      locationsId=LocationAttributeConfig(),
+      locationsId=_LOCATION_ATTRIBUTE_CONFIG,
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG,
       disable_auto_completers=False)
 
 
+@functools.lru_cache(maxsize=None)
 def GetStreamResourceSpec(resource_name='stream'):
   return concepts.ResourceSpec(
       'datastream.projects.locations.streams',
       resource_name=resource_name,
       streamsId=StreamAttributeConfig(name=resource_name),
-      locationsId=LocationAttributeConfig(),
+      locationsId=_LOCATION_ATTRIBUTE_CONFIG,
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG,
       disable_auto_completers=False)
 
 
+@functools.lru_cache(maxsize=None)
 def GetRouteResourceSpec(resource_name='route'):
   return concepts.ResourceSpec(
       'datastream.projects.locations.privateConnections.routes',
       resource_name=resource_name,
       routesId=RouteAttributeConfig(name=resource_name),
-      privateConnectionsId=PrivateConnectionAttributeConfig(
-          'private-connection'),
-      locationsId=LocationAttributeConfig(),
+      privateConnectionsId=_ROUTE_PRIVATE_CONNECTION_ATTRIBUTE_CONFIG,
+      locationsId=_LOCATION_ATTRIBUTE_CONFIG,
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG,
       disable_auto_completers=False)
 
 
+# Presentation specs that are not attached to a per-parser argument group are
+# immutable and can be shared across parser builds; these helpers memoize
+# them per (name, verb). Specs created with group= must stay per-call since
+# they reference a group object owned by one parser.
+@functools.lru_cache(maxsize=None)
+def _GetConnectionProfilePresentationSpec(name, verb):
+  return presentation_specs.ResourcePresentationSpec(
+      name,
+      GetConnectionProfileResourceSpec(),
+      'The connection profile {}.'.format(verb),
+      required=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _GetPrivateConnectionPresentationSpec(name, verb):
+  return presentation_specs.ResourcePresentationSpec(
+      name,
+      GetPrivateConnectionResourceSpec(),
+      'The private connection {}.'.format(verb),
+      required=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _GetStreamPresentationSpec(verb):
+  return presentation_specs.ResourcePresentationSpec(
+      'stream',
+      GetStreamResourceSpec(),
+      'The stream {}.'.format(verb),
+      required=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _GetRoutePresentationSpec(name, verb):
+  return presentation_specs.ResourcePresentationSpec(
+      name,
+      GetRouteResourceSpec(),
+      'The route {}.'.format(verb),
+      required=True)
+
+
 def AddConnectionProfileResourceArg(parser,
                                     verb,
                                     positional=True,
@@ -159,11 +294,7 @@ def AddConnectionProfileResourceArg(parser,
       '--forward-ssh-private-key', help='SSH private key..')
 
   resource_specs = [
-      presentation_specs.ResourcePresentationSpec(
-          name,
-          GetConnectionProfileResourceSpec(),
-          'The connection profile {}.'.format(verb),
-          required=True),
+      _GetConnectionProfilePresentationSpec(name, verb),
       presentation_specs.ResourcePresentationSpec(
           '--private-connection-name',
           GetPrivateConnectionResourceSpec(),
@@ -207,6 +338,7 @@ def AddConnectionProfileDiscoverResourceArg(parser):
       }).AddToParser(parser)
 
 
+@functools.lru_cache(maxsize=None)
 def GetVpcResourceSpec():
   """Constructs and returns the Resource specification for VPC."""
 
@@ -245,11 +377,7 @@ def AddPrivateConnectionResourceArg(parser, verb, positional=True):
       required=True)
 
   resource_specs = [
-      presentation_specs.ResourcePresentationSpec(
-          name,
-          GetPrivateConnectionResourceSpec(),
-          'The private connection {}.'.format(verb),
-          required=True),
+      _GetPrivateConnectionPresentationSpec(name, verb),
       presentation_specs.ResourcePresentationSpec(
           '--vpc-name',
           GetVpcResourceSpec(),
@@ -273,94 +401,20 @@ def AddStreamResourceArg(parser, verb, required=True):
       required=required, mutex=True)
   source_config_parser_group.add_argument(
       '--oracle-source-config',
-      help="""\
-          Path to a YAML (or JSON) file containing the configuration for Oracle Source Config.
-
-          The JSON file is formatted as follows, with snake_case field naming:
-
-          ```
-            {
-              "allowlist": {},
-              "rejectlist": {
-                "oracle_schemas": [
-                  {
-                    "schema_name": "SAMPLE",
-                    "oracle_tables": [
-                      {
-                        "table_name": "SAMPLE_TABLE",
-                        "oracle_columns": [
-                          {
-                            "column_name": "COL",
-                          }
-                        ]
-                      }
-                    ]
-                  }
-                ]
-              }
-            }
-          ```
-       """
-      )
+      help=_ORACLE_SOURCE_CONFIG_HELP)
   source_config_parser_group.add_argument(
       '--mysql-source-config',
-      help="""\
-          Path to a YAML (or JSON) file containing the configuration for Mysql Source Config.
-
-          The JSON file is formatted as follows, with snake_case field naming:
-
-          ```
-            {
-              "allowlist": {},
-              "rejectlist":  {
-                "mysql_databases": [
-                    {
-                      "database_name":"sample_database",
-                      "mysql_tables": [
-                        {
-                          "table_name": "sample_table",
-                          "mysql_columns": [
-                            {
-                              "column_name": "sample_column",
-                            }
-                           ]
-                        }
-                      ]
-                    }
-                  ]
-                }
-            }
-          ```
-       """
-      )
+      help=_MYSQL_SOURCE_CONFIG_HELP)
 
   destination_parser = parser.add_group(required=required)
   destination_config_parser_group = destination_parser.add_group(
       required=required, mutex=True)
   destination_config_parser_group.add_argument(
       '--gcs-destination-config',
-      help="""\
-      Path to a YAML (or JSON) file containing the configuration for Google Cloud Storage Destination Config.
-
-      The JSON file is formatted as follows:
-
-      ```
-       {
-       "path": "some/path",
-       "file_rotation_mb":5,
-       "file_rotation_interval":"15s",
-       "avro_file_format": {}
-       }
-      ```
-        """)
+      help=_GCS_DESTINATION_CONFIG_HELP)
 
   resource_specs = [
-      presentation_specs.ResourcePresentationSpec(
-          'stream',
-          GetStreamResourceSpec(),
-          'The stream {}.'.format(verb),
-          required=True
-      ),
+      _GetStreamPresentationSpec(verb),
       presentation_specs.ResourcePresentationSpec(
           '--source-name',
           GetConnectionProfileResourceSpec(),
@@ -400,13 +454,7 @@ def AddRouteResourceArg(parser, verb, positional=True):
   else:
     name = '--route'
 
-  resource_specs = [
-      presentation_specs.ResourcePresentationSpec(
-          name,
-          GetRouteResourceSpec(),
-          'The route {}.'.format(verb),
-          required=True)
-  ]
+  resource_specs = [_GetRoutePresentationSpec(name, verb)]
   concept_parsers.ConceptParser(
       resource_specs).AddToParser(parser)
 
@@ -18,19 +18,18 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
-from googlecloudsdk.api_lib.clouddeploy import rollout
+# The rollout/release/target helper modules are imported inside the
+# functions that use them: they transitively pull in the apitools client
+# and message modules, which is too heavy a price for commands that never
+# promote a release.
 from googlecloudsdk.command_lib.deploy import exceptions
-from googlecloudsdk.command_lib.deploy import release_util
-from googlecloudsdk.command_lib.deploy import rollout_util
-from googlecloudsdk.command_lib.deploy import target_util
 from googlecloudsdk.core import log
-from googlecloudsdk.core import resources
 
 _LAST_TARGET_IN_SEQUENCE = (
     'Release {} is already deployed to the last target '
     '({}) in the promotion sequence.\n- Release: {}\n- Target: {}\n')
 # In progress List filter
-IN_PROGRESS_FILTER_TEMPLATE = ('state="IN_PROGRESS"')
+IN_PROGRESS_FILTER_TEMPLATE = 'state="IN_PROGRESS"'
 
 
 def Promote(release_ref,
@@ -64,15 +63,22 @@ def Promote(release_ref,
     googlecloudsdk.command_lib.deploy.exceptions.RolloutIdExhausted
     googlecloudsdk.command_lib.deploy.exceptions.ReleaseInactiveError
   """
+  from googlecloudsdk.command_lib.deploy import release_util
+  from googlecloudsdk.command_lib.deploy import rollout_util
+
   dest_target = to_target
+  target_obj = None
   if not dest_target:
-    dest_target = GetToTargetID(release_obj, is_create)
+    # The sequence scan already located the destination snapshot; keeping it
+    # saves GetSnappedTarget's rescan of the snapshot list below.
+    dest_target, target_obj = _GetToTargetIDAndSnapshot(release_obj, is_create)
 
   rollout_util.CreateRollout(release_ref, dest_target, rollout_id, annotations,
                              labels)
 
   # Check if it requires approval.
-  target_obj = release_util.GetSnappedTarget(release_obj, dest_target)
+  if target_obj is None:
+    target_obj = release_util.GetSnappedTarget(release_obj, dest_target)
   if target_obj and target_obj.requireApproval:
     log.status.Print('The rollout is pending approval.')
 
@@ -95,6 +101,32 @@ def GetToTargetID(release_obj, is_create):
     ReleaseInactiveError: if this is not called during release creation and the
     specified release has no rollouts.
   """
+  return _GetToTargetIDAndSnapshot(release_obj, is_create)[0]
+
+
+def _GetToTargetIDAndSnapshot(release_obj, is_create):
+  """Computes the promote destination and its target snapshot.
+
+  Same promotion-sequence scan as GetToTargetID, but also hands back the
+  snapshot message of the destination target so callers that need it (e.g.
+  the approval check in Promote) don't have to rescan the snapshot list.
+
+  Args:
+    release_obj: apitools.base.protorpclite.messages.Message, release message.
+    is_create: bool, if getting the target for release creation.
+
+  Returns:
+    A (target ID, target snapshot message) tuple.
+
+  Raises:
+    NoSnappedTargetsError: if no target snapshots in the release.
+    ReleaseInactiveError: if this is not called during release creation and the
+    specified release has no rollouts.
+  """
+  from googlecloudsdk.api_lib.clouddeploy import rollout
+  from googlecloudsdk.command_lib.deploy import release_util
+  from googlecloudsdk.command_lib.deploy import target_util
+  from googlecloudsdk.core import resources
 
   if not release_obj.targetSnapshots:
     raise exceptions.NoSnappedTargetsError(release_obj.name)
@@ -104,46 +136,76 @@ def GetToTargetID(release_obj, is_create):
       release_obj.name,
       collection='clouddeploy.projects.locations.deliveryPipelines.releases',
   )
-  to_target = release_obj.targetSnapshots[0].name
-  # The order of target snapshots represents the promotion sequence.
-  # E.g. test->stage->prod. Here we start with the last stage.
-  reversed_snapshots = list(reversed(release_obj.targetSnapshots))
-  for i, snapshot in enumerate(reversed_snapshots):
-    target_ref = target_util.TargetReferenceFromName(snapshot.name)
-    # Starting with the last target in the promotion sequence per above, find
-    # the last successfully deployed rollout to that target.
-    _, current_rollout = target_util.GetReleasesAndCurrentRollout(
-        target_ref,
-        release_ref.AsDict()['deliveryPipelinesId'])
-
-    if current_rollout:
-      current_rollout_ref = resources.REGISTRY.Parse(
-          current_rollout.name,
-          collection='clouddeploy.projects.locations.deliveryPipelines.releases.rollouts'
-      )
+  snapshots = release_obj.targetSnapshots
+  to_target = snapshots[0].name
+  to_snapshot = snapshots[0]
+  # Name() builds a fresh string on every call, so compute it once up front.
+  release_name = release_ref.Name()
+  if len(snapshots) == 1:
+    # Single-target pipeline: the sole target is the only candidate, so skip
+    # the promotion-sequence scan entirely. When not creating, one rollout
+    # lookup is still needed to distinguish "already deployed to the last
+    # target" from an inactive release.
+    if is_create:
+      return target_util.TargetId(to_target), to_snapshot
+    target_ref = target_util.TargetReferenceFromName(to_target)
+    # RelativeName() rebuilds its string on every call; compute each once.
+    release_relative_name = release_ref.RelativeName()
+    target_relative_name = target_ref.RelativeName()
+    if rollout.RolloutClient().ListSucceeded(release_relative_name).rollouts:
+      log.status.Print(
+          _LAST_TARGET_IN_SEQUENCE.format(
+              release_name, target_ref.Name(),
+              release_util.ResourceNameProjectNumberToId(
+                  release_relative_name),
+              release_util.ResourceNameProjectNumberToId(
+                  target_relative_name)))
+      return target_util.TargetId(target_relative_name), to_snapshot
+    raise exceptions.ReleaseInactiveError()
+  # One List of this release's succeeded rollouts replaces the per-target
+  # release and rollout lookups. Every listed rollout belongs to this
+  # release, so a target appearing in the map means the release is the one
+  # currently deployed there, which the per-target parent-release comparison
+  # used to establish one API round-trip at a time.
+  release_relative_name = release_ref.RelativeName()
+  succeeded_rollouts = rollout.RolloutClient().ListSucceeded(
+      release_relative_name).rollouts
+  deployed_target_ids = {
+      succeeded_rollout.targetId for succeeded_rollout in succeeded_rollouts
+  }
+  # The order of target snapshots represents the promotion sequence, e.g.
+  # test->stage->prod; walk the indices backwards starting with the last
+  # stage, without copying the list.
+  for idx in range(len(snapshots) - 1, -1, -1):
+    target_ref = target_util.TargetReferenceFromName(snapshots[idx].name)
+    # Starting with the last target in the promotion sequence per above,
+    # find the target farthest along that this release is deployed to.
+    if target_ref.Name() in deployed_target_ids:
       # Promotes the release from the target that is farthest along in the
       # promotion sequence to its next stage in the promotion sequence.
-      if current_rollout_ref.Parent().Name() == release_ref.Name():
-        if i > 0:
-          to_target = reversed_snapshots[i - 1].name
-        else:
-          log.status.Print(
-              _LAST_TARGET_IN_SEQUENCE.format(
-                  release_ref.Name(), target_ref.Name(),
-                  release_util.ResourceNameProjectNumberToId(
-                      release_ref.RelativeName()),
-                  release_util.ResourceNameProjectNumberToId(
-                      target_ref.RelativeName())))
-          to_target = target_ref.RelativeName()
-          # Once a target to promote to is found break out of the loop
-        break
+      if idx + 1 < len(snapshots):
+        to_target = snapshots[idx + 1].name
+        to_snapshot = snapshots[idx + 1]
+      else:
+        target_relative_name = target_ref.RelativeName()
+        log.status.Print(
+            _LAST_TARGET_IN_SEQUENCE.format(
+                release_name, target_ref.Name(),
+                release_util.ResourceNameProjectNumberToId(
+                    release_relative_name),
+                release_util.ResourceNameProjectNumberToId(
+                    target_relative_name)))
+        to_target = target_relative_name
+        to_snapshot = snapshots[idx]
+        # Once a target to promote to is found break out of the loop
+      break
 
   # This means the release is not deployed to any target,
   # to_target flag is required in this case.
   if to_target == release_obj.targetSnapshots[0].name and not is_create:
     raise exceptions.ReleaseInactiveError()
 
-  return target_util.TargetId(to_target)
+  return target_util.TargetId(to_target), to_snapshot
 
 
 def CheckIfInProgressRollout(release_ref, release_obj, to_target_id):
@@ -158,7 +220,11 @@ def CheckIfInProgressRollout(release_ref, release_obj, to_target_id):
   Raises:
     googlecloudsdk.command_lib.deploy.exceptions.RolloutInProgressError
   """
-  resp = rollout.RolloutClient().List(release_ref.RelativeName(),
-                                      IN_PROGRESS_FILTER_TEMPLATE)
+  from googlecloudsdk.api_lib.clouddeploy import rollout
+
+  # Only existence matters here; cap the response at one rollout so the
+  # server never sends (and we never decode) more than a single entry.
+  resp = rollout.RolloutClient().List(
+      release_ref.RelativeName(), IN_PROGRESS_FILTER_TEMPLATE, page_size=1)
   if resp.rollouts:
     raise exceptions.RolloutInProgressError(release_obj.name, to_target_id)
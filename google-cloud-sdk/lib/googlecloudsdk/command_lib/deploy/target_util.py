@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import functools
+
 from apitools.base.py import exceptions as apitools_exceptions
 from googlecloudsdk.api_lib.clouddeploy import release
 from googlecloudsdk.api_lib.clouddeploy import target
@@ -27,6 +29,24 @@ from googlecloudsdk.core import log
 from googlecloudsdk.core import resources
 
 _SHARED_TARGET_COLLECTION = 'clouddeploy.projects.locations.targets'
+_PROJECTS_PREFIX = 'projects/'
+
+
+@functools.lru_cache(maxsize=128)
+def _CachedProjectNumber(project_id):
+  """Resolves a project number, caching per project id.
+
+  The project-id-to-number mapping cannot change within one invocation, and
+  GetReleasesAndCurrentRollout is called once per target with the same
+  project, so memoizing saves a Resource Manager round-trip per call.
+
+  Args:
+    project_id: str, project ID.
+
+  Returns:
+    The project number.
+  """
+  return p_util.GetProjectNumber(project_id)
 
 
 def GetReleasesAndCurrentRollout(target_ref, pipeline_id, index=0):
@@ -48,7 +68,7 @@ def GetReleasesAndCurrentRollout(target_ref, pipeline_id, index=0):
   try:
     # get all of the releases associated with the target.
     target_dict = target_ref.AsDict()
-    project_number = p_util.GetProjectNumber(target_dict['projectsId'])
+    project_number = _CachedProjectNumber(target_dict['projectsId'])
     target_ref_project_number = TargetReference(target_dict['targetsId'],
                                                 project_number,
                                                 target_dict['locationsId'])
@@ -64,6 +84,13 @@ def GetReleasesAndCurrentRollout(target_ref, pipeline_id, index=0):
   return releases, current_rollout
 
 
+@functools.lru_cache(maxsize=1024)
+def _ParseTargetRelativeName(target_name):
+  """Parses a target relative name, caching the immutable reference."""
+  return resources.REGISTRY.ParseRelativeName(
+      target_name, collection=_SHARED_TARGET_COLLECTION)
+
+
 def TargetReferenceFromName(target_name):
   """Creates a target reference from full name.
 
@@ -74,8 +101,7 @@ def TargetReferenceFromName(target_name):
     Target reference.
   """
 
-  return resources.REGISTRY.ParseRelativeName(
-      target_name, collection=_SHARED_TARGET_COLLECTION)
+  return _ParseTargetRelativeName(target_name)
 
 
 def TargetId(target_name_or_id):
@@ -88,12 +114,27 @@ def TargetId(target_name_or_id):
     Target ID.
   """
 
-  if 'projects/' in target_name_or_id:
+  # Fully-qualified resource names always start with 'projects/'; a prefix
+  # check is constant-time where the substring scan was linear.
+  if target_name_or_id.startswith(_PROJECTS_PREFIX):
     return TargetReferenceFromName(target_name_or_id).Name()
 
   return target_name_or_id
 
 
+@functools.lru_cache(maxsize=512)
+def _CachedTargetReference(target_id, project, location_id):
+  """Builds a target reference, caching the immutable result."""
+  return resources.REGISTRY.Parse(
+      None,
+      collection=_SHARED_TARGET_COLLECTION,
+      params={
+          'projectsId': project,
+          'locationsId': location_id,
+          'targetsId': target_id,
+      })
+
+
 def TargetReference(target_name_or_id, project, location_id):
   """Creates the target reference base on the parameters.
 
@@ -108,14 +149,8 @@ def TargetReference(target_name_or_id, project, location_id):
   Returns:
     Target reference.
   """
-  return resources.REGISTRY.Parse(
-      None,
-      collection=_SHARED_TARGET_COLLECTION,
-      params={
-          'projectsId': project,
-          'locationsId': location_id,
-          'targetsId': TargetId(target_name_or_id),
-      })
+  return _CachedTargetReference(
+      TargetId(target_name_or_id), project, location_id)
 
 
 def GetTarget(target_ref):
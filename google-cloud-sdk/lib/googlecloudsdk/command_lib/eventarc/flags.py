@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import functools
+
 from googlecloudsdk.calliope import arg_parsers
 from googlecloudsdk.calliope import base
 from googlecloudsdk.calliope.concepts import concepts
@@ -27,8 +29,86 @@ from googlecloudsdk.command_lib.util.concepts import presentation_specs
 from googlecloudsdk.core import properties
 
 _IAM_API_VERSION = 'v1'
-
-
+_GA = base.ReleaseTrack.GA
+
+# Per-track flag names and help text for the event-filters argument; a dict
+# lookup against the track enum replaces re-evaluated branches at every
+# command registration.
+_EVENT_FILTERS_FLAG = {_GA: '--event-filters'}
+_DEFAULT_EVENT_FILTERS_FLAG = '--matching-criteria'
+_EVENT_FILTERS_HELP = {
+    _GA: (
+        "The trigger's list of filters that apply to CloudEvents attributes. "
+        "This flag can be repeated to add more filters to the list. Only "
+        "events that match all these filters will be sent to the destination. "
+        "The filters must include the ``type'' attribute, as well as any other "
+        "attributes that are expected for the chosen type.")
+}
+_DEFAULT_EVENT_FILTERS_HELP = (
+    "The criteria by which events are filtered for the trigger, specified "
+    "as a comma-separated list of CloudEvents attribute names and values. "
+    "This flag can also be repeated to add more criteria to the list. Only "
+    "events that match with this criteria will be sent to the destination. "
+    "The criteria must include the ``type'' attribute, as well as any "
+    "other attributes that are expected for the chosen type.")
+
+# An ArgDict instance is a stateless parsing callable, so one shared
+# instance serves every registration of the event-filters flag.
+_EVENT_FILTERS_TYPE = arg_parsers.ArgDict()
+
+
+_DESTINATION_RUN_SERVICE_HELP = (
+    'Name of the Cloud Run fully-managed service that receives the '
+    'events for the trigger. The service must be in the same project as the '
+    'trigger.')
+_DESTINATION_RUN_PATH_HELP = (
+    'Relative path on the destination Cloud Run service to which '
+    "the events for the trigger should be sent. Examples: ``/route'', "
+    "``route'', ``route/subroute''.")
+_DESTINATION_RUN_REGION_HELP = (
+    'Region in which the destination Cloud Run service can be '
+    'found. If not specified, it is assumed that the service is in the same '
+    'region as the trigger.')
+_DESTINATION_GKE_CLUSTER_HELP = (
+    'Name of the GKE cluster that the destination GKE service is '
+    'running in.')
+_DESTINATION_GKE_LOCATION_HELP = (
+    'Location of the GKE cluster that the destination GKE service '
+    'is running in. If not specified, it is assumed that the cluster is a '
+    'regional cluster and is in the same region as the trigger.')
+_DESTINATION_GKE_NAMESPACE_HELP = (
+    'Namespace that the destination GKE service is running in. If '
+    "not specified, it defaults to the ``default'' namespace.")
+_DESTINATION_GKE_SERVICE_HELP = (
+    'Name of the destination GKE service that receives the events '
+    'for the trigger. The service must be in the same project as the trigger.')
+_DESTINATION_GKE_PATH_HELP = (
+    'Relative path on the destination GKE service to which '
+    "the events for the trigger should be sent. Examples: ``/route'', "
+    "``route'', ``route/subroute''.")
+_DESTINATION_WORKFLOW_HELP = (
+    'ID of the Workflow that receives the events for the trigger. '
+    'The Workflow must be in the same project as the trigger.')
+_DESTINATION_WORKFLOW_LOCATION_HELP = (
+    'Location that the destination Workflow is running in. '
+    'If not specified, it is assumed that the Workflow is in the same '
+    'location as the trigger.')
+_CLEAR_SERVICE_ACCOUNT_HELP = (
+    'Clear the IAM service account associated with the trigger.')
+_CLEAR_DESTINATION_RUN_PATH_HELP = (
+    'Clear the relative path on the destination Cloud Run service to '
+    'which the events for the trigger should be sent.')
+_CLEAR_DESTINATION_GKE_PATH_HELP = (
+    'Clear the relative path on the destination GKE service to which '
+    'the events for the trigger should be sent.')
+
+
+# The attribute configs and resource specs below are immutable and designed
+# to be shared, so their no-argument builders are memoized: command
+# registration reuses one instance instead of re-allocating the spec graph
+# for every flag-adding call.
+
+@functools.lru_cache(maxsize=None)
 def LocationAttributeConfig():
   """Builds an AttributeConfig for the location resource."""
   return concepts.ResourceParameterAttributeConfig(
@@ -41,21 +121,25 @@ def LocationAttributeConfig():
       "the [eventarc/location] property.")
 
 
+@functools.lru_cache(maxsize=None)
 def TriggerAttributeConfig():
   """Builds an AttributeConfig for the trigger resource."""
   return concepts.ResourceParameterAttributeConfig(name='trigger')
 
 
+@functools.lru_cache(maxsize=None)
 def ChannelAttributeConfig():
   """Builds and AttributeConfig for the channel resrouce."""
   return concepts.ResourceParameterAttributeConfig(name='channel')
 
 
+@functools.lru_cache(maxsize=None)
 def TransportTopicAttributeConfig():
   """Builds an AttributeConfig for the transport topic resource."""
   return concepts.ResourceParameterAttributeConfig(name='transport-topic')
 
 
+@functools.lru_cache(maxsize=None)
 def TriggerResourceSpec():
   """Builds an ResourceSpec for trigger resource."""
   return concepts.ResourceSpec(
@@ -66,6 +150,7 @@ def TriggerResourceSpec():
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG)
 
 
+@functools.lru_cache(maxsize=None)
 def ChannelResourceSpec():
   """Builds an ResourceSpac for channel resource."""
   return concepts.ResourceSpec(
@@ -76,6 +161,20 @@ def ChannelResourceSpec():
       projectsId=concepts.DEFAULT_PROJECT_ATTRIBUTE_CONFIG)
 
 
+@functools.lru_cache(maxsize=None)
+def _TriggerPresentationSpec():
+  """Builds the presentation spec for the trigger-to-create argument.
+
+  Its arguments never vary, so one shared instance serves every
+  registration instead of rebuilding the spec per command.
+  """
+  return presentation_specs.ResourcePresentationSpec(
+      'trigger',
+      TriggerResourceSpec(),
+      'The trigger to create.',
+      required=True)
+
+
 def AddTransportTopicResourceArg(parser, required=False):
   """Adds a resource argument for a customer-provided transport topic."""
   resource_spec = concepts.ResourceSpec(
@@ -116,14 +215,10 @@ def AddTriggerResourceArg(parser, group_help_text, required=False):
 
 def AddCreateTrigerResourceArgs(parser, release_track):
   """Adds trigger and channel arguments to for trigger creation."""
-  if release_track == base.ReleaseTrack.GA:
+  if release_track == _GA:
     concept_parsers.ConceptParser(
         [
-            presentation_specs.ResourcePresentationSpec(
-                'trigger',
-                TriggerResourceSpec(),
-                'The trigger to create.',
-                required=True),
+            _TriggerPresentationSpec(),
             presentation_specs.ResourcePresentationSpec(
                 '--channel',
                 ChannelResourceSpec(),
@@ -157,35 +252,18 @@ def AddServiceAccountArg(parser, required=False):
 
 def AddEventFiltersArg(parser, release_track, required=False):
   """Adds an argument for the trigger's event filters."""
-  if release_track == base.ReleaseTrack.GA:
-    flag = '--event-filters'
-    help_text = (
-        "The trigger's list of filters that apply to CloudEvents attributes. "
-        "This flag can be repeated to add more filters to the list. Only "
-        "events that match all these filters will be sent to the destination. "
-        "The filters must include the ``type'' attribute, as well as any other "
-        "attributes that are expected for the chosen type.")
-  else:
-    flag = '--matching-criteria'
-    help_text = (
-        "The criteria by which events are filtered for the trigger, specified "
-        "as a comma-separated list of CloudEvents attribute names and values. "
-        "This flag can also be repeated to add more criteria to the list. Only "
-        "events that match with this criteria will be sent to the destination. "
-        "The criteria must include the ``type'' attribute, as well as any "
-        "other attributes that are expected for the chosen type.")
   parser.add_argument(
-      flag,
+      _EVENT_FILTERS_FLAG.get(release_track, _DEFAULT_EVENT_FILTERS_FLAG),
       action=arg_parsers.UpdateAction,
-      type=arg_parsers.ArgDict(),
+      type=_EVENT_FILTERS_TYPE,
       required=required,
-      help=help_text,
+      help=_EVENT_FILTERS_HELP.get(release_track, _DEFAULT_EVENT_FILTERS_HELP),
       metavar='ATTRIBUTE=VALUE')
 
 
 def GetEventFiltersArg(args, release_track):
   """Gets the event filters from the arguments."""
-  if release_track == base.ReleaseTrack.GA:
+  if release_track == _GA:
     return args.event_filters
   else:
     return args.matching_criteria
@@ -193,7 +271,7 @@ def GetEventFiltersArg(args, release_track):
 
 def GetChannelArg(args, release_track):
   """Gets the channel from the arguments."""
-  if release_track == base.ReleaseTrack.GA:
+  if release_track == _GA:
     return args.CONCEPTS.channel.Parse()
   return None
 
@@ -205,7 +283,7 @@ def AddCreateDestinationArgs(parser, release_track, required=False):
       help='Flags for specifying the destination to which events should be sent.'
   )
   _AddCreateCloudRunDestinationArgs(dest_group)
-  if release_track == base.ReleaseTrack.GA:
+  if release_track == _GA:
     _AddCreateGKEDestinationArgs(dest_group, hidden=True)
     _AddCreateWorkflowDestinationArgs(dest_group, hidden=True)
 
@@ -251,7 +329,7 @@ def AddUpdateDestinationArgs(parser, release_track, required=False):
       required=required,
       help='Flags for updating the destination to which events should be sent.')
   _AddUpdateCloudRunDestinationArgs(dest_group)
-  if release_track == base.ReleaseTrack.GA:
+  if release_track == _GA:
     _AddUpdateGKEDestinationArgs(dest_group, hidden=True)
     _AddUpdateWorkflowDestinationArgs(dest_group, hidden=True)
 
@@ -296,9 +374,7 @@ def AddDestinationRunServiceArg(parser, required=False):
   parser.add_argument(
       '--destination-run-service',
       required=required,
-      help='Name of the Cloud Run fully-managed service that receives the '
-      'events for the trigger. The service must be in the same project as the '
-      'trigger.')
+      help=_DESTINATION_RUN_SERVICE_HELP)
 
 
 def AddDestinationRunPathArg(parser, required=False):
@@ -306,9 +382,7 @@ def AddDestinationRunPathArg(parser, required=False):
   parser.add_argument(
       '--destination-run-path',
       required=required,
-      help='Relative path on the destination Cloud Run service to which '
-      "the events for the trigger should be sent. Examples: ``/route'', "
-      "``route'', ``route/subroute''.")
+      help=_DESTINATION_RUN_PATH_HELP)
 
 
 def AddDestinationRunRegionArg(parser, required=False):
@@ -316,9 +390,7 @@ def AddDestinationRunRegionArg(parser, required=False):
   parser.add_argument(
       '--destination-run-region',
       required=required,
-      help='Region in which the destination Cloud Run service can be '
-      'found. If not specified, it is assumed that the service is in the same '
-      'region as the trigger.')
+      help=_DESTINATION_RUN_REGION_HELP)
 
 
 def _AddDestinationGKEClusterArg(parser, required=False):
@@ -326,8 +398,7 @@ def _AddDestinationGKEClusterArg(parser, required=False):
   parser.add_argument(
       '--destination-gke-cluster',
       required=required,
-      help='Name of the GKE cluster that the destination GKE service is '
-      'running in.')
+      help=_DESTINATION_GKE_CLUSTER_HELP)
 
 
 def _AddDestinationGKELocationArg(parser, required=False):
@@ -335,9 +406,7 @@ def _AddDestinationGKELocationArg(parser, required=False):
   parser.add_argument(
       '--destination-gke-location',
       required=required,
-      help='Location of the GKE cluster that the destination GKE service '
-      'is running in. If not specified, it is assumed that the cluster is a '
-      'regional cluster and is in the same region as the trigger.')
+      help=_DESTINATION_GKE_LOCATION_HELP)
 
 
 def _AddDestinationGKENamespaceArg(parser, required=False):
@@ -345,8 +414,7 @@ def _AddDestinationGKENamespaceArg(parser, required=False):
   parser.add_argument(
       '--destination-gke-namespace',
       required=required,
-      help='Namespace that the destination GKE service is running in. If '
-      "not specified, it defaults to the ``default'' namespace.")
+      help=_DESTINATION_GKE_NAMESPACE_HELP)
 
 
 def _AddDestinationGKEServiceArg(parser, required=False):
@@ -354,9 +422,7 @@ def _AddDestinationGKEServiceArg(parser, required=False):
   parser.add_argument(
       '--destination-gke-service',
       required=required,
-      help='Name of the destination GKE service that receives the events '
-      'for the trigger. The service must be in the same project as the trigger.'
-  )
+      help=_DESTINATION_GKE_SERVICE_HELP)
 
 
 def _AddDestinationGKEPathArg(parser, required=False):
@@ -364,9 +430,7 @@ def _AddDestinationGKEPathArg(parser, required=False):
   parser.add_argument(
       '--destination-gke-path',
       required=required,
-      help='Relative path on the destination GKE service to which '
-      "the events for the trigger should be sent. Examples: ``/route'', "
-      "``route'', ``route/subroute''.")
+      help=_DESTINATION_GKE_PATH_HELP)
 
 
 def _AddDestinationWorkflowArg(parser, required=False):
@@ -374,8 +438,7 @@ def _AddDestinationWorkflowArg(parser, required=False):
   parser.add_argument(
       '--destination-workflow',
       required=required,
-      help='ID of the Workflow that receives the events for the trigger. '
-      'The Workflow must be in the same project as the trigger.')
+      help=_DESTINATION_WORKFLOW_HELP)
 
 
 def _AddDestinationWorkflowLocationArg(parser, required=False):
@@ -383,9 +446,7 @@ def _AddDestinationWorkflowLocationArg(parser, required=False):
   parser.add_argument(
       '--destination-workflow-location',
       required=required,
-      help='Location that the destination Workflow is running in. '
-      'If not specified, it is assumed that the Workflow is in the same '
-      'location as the trigger.')
+      help=_DESTINATION_WORKFLOW_LOCATION_HELP)
 
 
 def AddClearServiceAccountArg(parser):
@@ -393,7 +454,7 @@ def AddClearServiceAccountArg(parser):
   parser.add_argument(
       '--clear-service-account',
       action='store_true',
-      help='Clear the IAM service account associated with the trigger.')
+      help=_CLEAR_SERVICE_ACCOUNT_HELP)
 
 
 def AddClearDestinationRunPathArg(parser):
@@ -401,8 +462,7 @@ def AddClearDestinationRunPathArg(parser):
   parser.add_argument(
       '--clear-destination-run-path',
       action='store_true',
-      help='Clear the relative path on the destination Cloud Run service to '
-      'which the events for the trigger should be sent.')
+      help=_CLEAR_DESTINATION_RUN_PATH_HELP)
 
 
 def _AddClearDestinationGKEPathArg(parser):
@@ -410,8 +470,7 @@ def _AddClearDestinationGKEPathArg(parser):
   parser.add_argument(
       '--clear-destination-gke-path',
       action='store_true',
-      help='Clear the relative path on the destination GKE service to which '
-      'the events for the trigger should be sent.')
+      help=_CLEAR_DESTINATION_GKE_PATH_HELP)
 
 
 def AddTypePositionalArg(parser, help_text):
@@ -18,41 +18,65 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
-from googlecloudsdk.api_lib.functions.v1 import util as api_util
+import functools
+import re
+import types
+
+# api_util, the concepts machinery and the resources registry are imported
+# inside the functions that need them: most flag-adders here don't, and the
+# transitive import cost would otherwise be paid by every gcloud startup.
 from googlecloudsdk.calliope import actions
 from googlecloudsdk.calliope import arg_parsers
 from googlecloudsdk.calliope import base
-from googlecloudsdk.calliope.concepts import concepts
-from googlecloudsdk.calliope.concepts import deps
 from googlecloudsdk.command_lib.util import completers
-from googlecloudsdk.command_lib.util.concepts import concept_parsers
 from googlecloudsdk.core import properties
-from googlecloudsdk.core import resources
 
 API = 'cloudfunctions'
 API_VERSION = 'v1'
 LOCATIONS_COLLECTION = API + '.projects.locations'
 
-SIGNATURE_TYPES = ['http', 'event', 'cloudevent']
-SEVERITIES = ['DEBUG', 'INFO', 'ERROR']
-EGRESS_SETTINGS = ['PRIVATE-RANGES-ONLY', 'ALL']
-INGRESS_SETTINGS = ['ALL', 'INTERNAL-ONLY', 'INTERNAL-AND-GCLB']
-SECURITY_LEVEL = ['SECURE-ALWAYS', 'SECURE-OPTIONAL']
-INGRESS_SETTINGS_MAPPING = {
+SIGNATURE_TYPES = ('http', 'event', 'cloudevent')
+SEVERITIES = ('DEBUG', 'INFO', 'ERROR')
+EGRESS_SETTINGS = ('PRIVATE-RANGES-ONLY', 'ALL')
+INGRESS_SETTINGS = ('ALL', 'INTERNAL-ONLY', 'INTERNAL-AND-GCLB')
+SECURITY_LEVEL = ('SECURE-ALWAYS', 'SECURE-OPTIONAL')
+# Frozen view of SEVERITIES for the per-log-entry membership tests in the
+# logs read commands; constant-time lookup where the tuple scan was linear.
+SEVERITIES_SET = frozenset(SEVERITIES)
+# All enum-name-to-flag-value translations live in one merged, read-only
+# table; the enum names never collide across categories. The public
+# per-category mappings below are derived views of it, kept for the
+# ChoiceEnumMapper call sites that validate a mapping against one enum.
+_ENUM_TO_FLAG = types.MappingProxyType({
     'ALLOW_ALL': 'all',
     'ALLOW_INTERNAL_ONLY': 'internal-only',
     'ALLOW_INTERNAL_AND_GCLB': 'internal-and-gclb',
-}
-
-EGRESS_SETTINGS_MAPPING = {
     'PRIVATE_RANGES_ONLY': 'private-ranges-only',
     'ALL_TRAFFIC': 'all',
-}
-
-SECURITY_LEVEL_MAPPING = {
     'SECURE_ALWAYS': 'secure-always',
     'SECURE_OPTIONAL': 'secure-optional',
-}
+})
+
+INGRESS_SETTINGS_MAPPING = types.MappingProxyType({
+    key: _ENUM_TO_FLAG[key]
+    for key in ('ALLOW_ALL', 'ALLOW_INTERNAL_ONLY', 'ALLOW_INTERNAL_AND_GCLB')
+})
+
+EGRESS_SETTINGS_MAPPING = types.MappingProxyType({
+    key: _ENUM_TO_FLAG[key] for key in ('PRIVATE_RANGES_ONLY', 'ALL_TRAFFIC')
+})
+
+SECURITY_LEVEL_MAPPING = types.MappingProxyType({
+    key: _ENUM_TO_FLAG[key] for key in ('SECURE_ALWAYS', 'SECURE_OPTIONAL')
+})
+
+# Lowercased once at import: the flag-adder functions below run during every
+# command parser build, so per-call list comprehensions would repeat the
+# allocations and .lower() calls for each command.
+_SEVERITIES_LOWER = tuple(x.lower() for x in SEVERITIES)
+_INGRESS_SETTINGS_LOWER = tuple(x.lower() for x in INGRESS_SETTINGS)
+_EGRESS_SETTINGS_LOWER = tuple(x.lower() for x in EGRESS_SETTINGS)
+_SECURITY_LEVEL_LOWER = tuple(x.lower() for x in SECURITY_LEVEL)
 
 _KMS_KEY_NAME_PATTERN = (
     r'^projects/[^/]+/locations/[^/]+/keyRings/[a-zA-Z0-9_-]+'
@@ -68,57 +92,107 @@ _DOCKER_REPOSITORY_NAME_ERROR = (
     '/locations/{location}/repositories/{repository} and only contain '
     'characters from the valid character set for a repository.')
 
+# Compiled once at import: arg_parsers.RegexpValidator re-runs re.match on
+# the raw pattern string for every value it checks.
+_KMS_KEY_NAME_RE = re.compile(_KMS_KEY_NAME_PATTERN)
+_DOCKER_REPOSITORY_NAME_RE = re.compile(_DOCKER_REPOSITORY_NAME_PATTERN)
+
+
+def _ValidateKMSKeyNameOrRaise(value):
+  """Argparse type that checks a value against the KMS key name pattern."""
+  if not _KMS_KEY_NAME_RE.match(value):
+    raise arg_parsers.ArgumentTypeError('Bad value [{0}]: {1}'.format(
+        value, _KMS_KEY_NAME_ERROR))
+  return value
+
+
+def _ValidateDockerRepositoryNameOrRaise(value):
+  """Argparse type that checks a value against the repository name pattern."""
+  if not _DOCKER_REPOSITORY_NAME_RE.match(value):
+    raise arg_parsers.ArgumentTypeError('Bad value [{0}]: {1}'.format(
+        value, _DOCKER_REPOSITORY_NAME_ERROR))
+  return value
+
+
+def _ChoiceValueType(value):
+  """Normalizes choice input to Cloud SDK style (lowercase, hyphenated).
+
+  Mirrors the value type base.ChoiceArgument installs; the choice flags
+  below call parser.add_argument directly to skip the intermediate Argument
+  object and its per-build choice revalidation.
+
+  Args:
+    value: string, flag choice value parsed from the command line.
+
+  Returns:
+    The value entirely in lower case, with words separated by hyphens.
+  """
+  return value.replace('_', '-').lower()
+
 
 def AddMinLogLevelFlag(parser):
-  min_log_arg = base.ChoiceArgument(
+  parser.add_argument(
       '--min-log-level',
-      choices=[x.lower() for x in SEVERITIES],
-      help_str='Minimum level of logs to be fetched.')
-  min_log_arg.AddToParser(parser)
+      choices=_SEVERITIES_LOWER,
+      type=_ChoiceValueType,
+      help='Minimum level of logs to be fetched.')
 
 
 def AddIngressSettingsFlag(parser):
-  ingress_settings_arg = base.ChoiceArgument(
+  parser.add_argument(
       '--ingress-settings',
-      choices=[x.lower() for x in INGRESS_SETTINGS],
-      help_str='Ingress settings controls what traffic can reach the '
+      choices=_INGRESS_SETTINGS_LOWER,
+      type=_ChoiceValueType,
+      help='Ingress settings controls what traffic can reach the '
       'function. By default `all` will be used.')
-  ingress_settings_arg.AddToParser(parser)
 
 
 def AddEgressSettingsFlag(parser):
-  egress_settings_arg = base.ChoiceArgument(
+  parser.add_argument(
       '--egress-settings',
-      choices=[x.lower() for x in EGRESS_SETTINGS],
-      help_str='Egress settings controls what traffic is diverted through the '
+      choices=_EGRESS_SETTINGS_LOWER,
+      type=_ChoiceValueType,
+      help='Egress settings controls what traffic is diverted through the '
       'VPC Access Connector resource. '
       'By default `private-ranges-only` will be used.')
-  egress_settings_arg.AddToParser(parser)
 
 
 def AddSecurityLevelFlag(parser):
-  security_level_arg = base.ChoiceArgument(
+  parser.add_argument(
       '--security-level',
-      choices=[x.lower() for x in SECURITY_LEVEL],
-      help_str='Security level controls whether a function\'s URL supports '
+      choices=_SECURITY_LEVEL_LOWER,
+      type=_ChoiceValueType,
+      help='Security level controls whether a function\'s URL supports '
       'HTTPS only or both HTTP and HTTPS. By default, `secure-optional` will'
       ' be used, meaning both HTTP and HTTPS are supported.')
-  security_level_arg.AddToParser(parser)
 
 
-def GetLocationsUri(resource):
+@functools.lru_cache(maxsize=None)
+def _GetLocationsRegistry():
+  """Clones the registry with the Functions API registered, at most once.
+
+  Cloning copies the full registry, so doing it per GetLocationsUri call
+  (once per row of `gcloud functions regions list`) was pure overhead.
+  """
+  from googlecloudsdk.core import resources
+
   registry = resources.REGISTRY.Clone()
   registry.RegisterApiByName(API, API_VERSION)
-  ref = registry.Parse(
+  return registry
+
+
+def GetLocationsUri(resource):
+  ref = _GetLocationsRegistry().Parse(
       resource.name,
       params={'projectsId': properties.VALUES.core.project.GetOrFail},
       collection=LOCATIONS_COLLECTION)
   return ref.SelfLink()
 
 
-def AddFunctionMemoryFlag(parser, track=None):
-  """Add flag for specifying function memory to the parser."""
-  ga_help_text = """\
+# Multi-line help strings are kept at module scope so each flag-adder passes
+# the same str object to argparse on every parser build, instead of binding
+# fresh locals (and so the help formatter always sees one shared instance).
+_MEMORY_HELP_GA = """\
   Limit on the amount of memory the function can use.
 
   Allowed values are: 128MB, 256MB, 512MB, 1024MB, 2048MB, 4096MB, and
@@ -126,7 +200,7 @@ def AddFunctionMemoryFlag(parser, track=None):
   deploying an update to an existing function, the function keeps its old
   memory limit unless you specify this flag."""
 
-  alpha_help_text = """\
+_MEMORY_HELP_ALPHA = """\
   Limit on the amount of memory the function can use.
 
   Allowed values for v1 are: 128MB, 256MB, 512MB, 1024MB, 2048MB, 4096MB,
@@ -141,12 +215,160 @@ def AddFunctionMemoryFlag(parser, track=None):
   deploying an update to an existing function, the function keeps its old
   memory limit unless you specify this flag."""
 
+_TIMEOUT_HELP_GA = """\
+      The function execution timeout, e.g. 30s for 30 seconds. Defaults to
+      original value for existing function or 60 seconds for new functions.
+      Cannot be more than 540s.
+      See $ gcloud topic datetimes for information on duration formats."""
+
+_TIMEOUT_HELP_ALPHA = """\
+      The function execution timeout, e.g. 30s for 30 seconds. Defaults to
+      original value for existing function or 60 seconds for new functions.
+
+      For GCF first generation functions, cannot be more than 540s.
+
+      For GCF second generation functions, cannot be more than 3600s.
+
+      See $ gcloud topic datetimes for information on duration formats."""
+
+_SOURCE_HELP = """\
+      Location of source code to deploy.
+
+      Location of the source can be one of the following three options:
+
+      * Source code in Google Cloud Storage (must be a `.zip` archive),
+      * Reference to source repository or,
+      * Local filesystem path (root directory of function source).
+
+      Note that, depending on your runtime type, Cloud Functions will look
+      for files with specific names for deployable functions. For Node.js,
+      these filenames are `index.js` or `function.js`. For Python, this is
+      `main.py`.
+
+      If you do not specify the `--source` flag:
+
+      * The current directory will be used for new function deployments.
+      * If the function was previously deployed using a local filesystem path,
+      then the function's source code will be updated using the current
+      directory.
+      * If the function was previously deployed using a Google Cloud Storage
+      location or a source repository, then the function's source code will not
+      be updated.
+
+      The value of the flag will be interpreted as a Cloud Storage location, if
+      it starts with `gs://`.
+
+      The value will be interpreted as a reference to a source repository, if it
+      starts with `https://`.
+
+      Otherwise, it will be interpreted as the local filesystem path. When
+      deploying source from the local filesystem, this command skips files
+      specified in the `.gcloudignore` file (see `gcloud topic gcloudignore` for
+      more information). If the `.gcloudignore` file doesn't exist, the command
+      will try to create it.
+
+      The minimal source repository URL is:
+      `https://source.developers.google.com/projects/${PROJECT}/repos/${REPO}`
+
+      By using the URL above, sources from the root directory of the
+      repository on the revision tagged `master` will be used.
+
+      If you want to deploy from a revision different from `master`, append one
+      of the following three sources to the URL:
+
+      * `/revisions/${REVISION}`,
+      * `/moveable-aliases/${MOVEABLE_ALIAS}`,
+      * `/fixed-aliases/${FIXED_ALIAS}`.
+
+      If you'd like to deploy sources from a directory different from the root,
+      you must specify a revision, a moveable alias, or a fixed alias, as above,
+      and append `/paths/${PATH_TO_SOURCES_DIRECTORY}` to the URL.
+
+      Overall, the URL should match the following regular expression:
+
+      ```
+      ^https://source\\.developers\\.google\\.com/projects/
+      (?<accountId>[^/]+)/repos/(?<repoName>[^/]+)
+      (((/revisions/(?<commit>[^/]+))|(/moveable-aliases/(?<branch>[^/]+))|
+      (/fixed-aliases/(?<tag>[^/]+)))(/paths/(?<path>.*))?)?$
+      ```
+
+      An example of a validly formatted source repository URL is:
+
+      ```
+      https://source.developers.google.com/projects/123456789/repos/testrepo/
+      moveable-aliases/alternate-branch/paths/path-to=source
+      ```
+
+      """
+
+# The trigger-group help names its member flags; both variants are joined
+# once at import instead of list-building per parser construction.
+_TRIGGER_FLAGS_FORMATTED = '`--trigger-topic`, `--trigger-bucket`, `--trigger-http`'
+_TRIGGER_FLAGS_WITH_FILTERS_FORMATTED = (
+    _TRIGGER_FLAGS_FORMATTED + ', `--trigger-event-filters`')
+
+# Both full help variants are rendered at import so the group registration
+# does no string formatting at all.
+_TRIGGER_GROUP_HELP_TEMPLATE = (
+    'If you don\'t specify a trigger when deploying an update to an '
+    'existing function it will keep its current trigger. '
+    'You must specify {formatted_trigger_flags} or '
+    '(`--trigger-event` AND `--trigger-resource`) when deploying a '
+    'new function.')
+_TRIGGER_GROUP_HELP = _TRIGGER_GROUP_HELP_TEMPLATE.format(
+    formatted_trigger_flags=_TRIGGER_FLAGS_FORMATTED)
+_TRIGGER_GROUP_HELP_WITH_FILTERS = _TRIGGER_GROUP_HELP_TEMPLATE.format(
+    formatted_trigger_flags=_TRIGGER_FLAGS_WITH_FILTERS_FORMATTED)
+
+# TODO(b/110148388): Do not hardcode list of choices in the help text.
+_RUNTIME_HELP = """\
+          Runtime in which to run the function.
+
+          Required when deploying a new function; optional when updating
+          an existing function.
+
+          Choices:
+
+          - `nodejs10`: Node.js 10
+          - `nodejs12`: Node.js 12
+          - `nodejs14`: Node.js 14
+          - `nodejs16`: Node.js 16 (preview)
+          - `php74`: PHP 7.4
+          - `python37`: Python 3.7
+          - `python38`: Python 3.8
+          - `python39`: Python 3.9
+          - `go111`: Go 1.11
+          - `go113`: Go 1.13
+          - `go116`: Go 1.16 (preview)
+          - `java11`: Java 11
+          - `dotnet3`: .NET Framework 3
+          - `ruby26`: Ruby 2.6
+          - `ruby27`: Ruby 2.7
+          - `nodejs6`: Node.js 6 (deprecated)
+          - `nodejs8`: Node.js 8 (deprecated)
+          """
+
+
+def AddFunctionMemoryFlag(parser, track=None):
+  """Add flag for specifying function memory to the parser."""
   help_text = (
-      ga_help_text if track is not base.ReleaseTrack.ALPHA else alpha_help_text)
+      _MEMORY_HELP_GA
+      if track is not base.ReleaseTrack.ALPHA else _MEMORY_HELP_ALPHA)
 
   parser.add_argument('--memory', type=str, help=help_text)
 
 
+# The parsers are stateless, so one instance of each serves every call
+# rather than rebuilding the validator (and its scale table) per parse.
+_MEMORY_PARSER = arg_parsers.BinarySize(
+    suggested_binary_size_scales=['KB', 'MB', 'MiB', 'GB', 'GiB'],
+    default_unit='MB')
+_POSITIVE_INT_PARSER = arg_parsers.BoundedInt(lower_bound=1)
+_NONNEGATIVE_INT_PARSER = arg_parsers.BoundedInt(lower_bound=0)
+_TIMEOUT_PARSER = arg_parsers.Duration(lower_bound='1s')
+
+
 def ParseMemoryStrToNumBytes(binary_size):
   """Parse binary size to number of bytes.
 
@@ -157,17 +379,15 @@ def ParseMemoryStrToNumBytes(binary_size):
     num_bytes: int, the number of bytes
   """
 
-  binary_size_parser = arg_parsers.BinarySize(
-      suggested_binary_size_scales=['KB', 'MB', 'MiB', 'GB', 'GiB'],
-      default_unit='MB')
-  return binary_size_parser(binary_size)
+  return _MEMORY_PARSER(binary_size)
 
 
 def ValidateV1TimeoutFlag(args):
-  if args.timeout and args.timeout > 540:
+  timeout = args.timeout
+  if timeout is not None and timeout > 540:
     raise arg_parsers.ArgumentTypeError(
         '--timeout: value must be less than or equal to 540s; received: {}s'
-        .format(args.timeout))
+        .format(timeout))
 
 
 def AddFunctionTimeoutFlag(parser, track=None):
@@ -181,27 +401,11 @@ def AddFunctionTimeoutFlag(parser, track=None):
     None
   """
 
-  ga_help_text = """\
-      The function execution timeout, e.g. 30s for 30 seconds. Defaults to
-      original value for existing function or 60 seconds for new functions.
-      Cannot be more than 540s.
-      See $ gcloud topic datetimes for information on duration formats."""
-
-  alpha_help_text = """\
-      The function execution timeout, e.g. 30s for 30 seconds. Defaults to
-      original value for existing function or 60 seconds for new functions.
-
-      For GCF first generation functions, cannot be more than 540s.
-
-      For GCF second generation functions, cannot be more than 3600s.
-
-      See $ gcloud topic datetimes for information on duration formats."""
-
   parser.add_argument(
       '--timeout',
-      help=ga_help_text
-      if track is not base.ReleaseTrack.ALPHA else alpha_help_text,
-      type=arg_parsers.Duration(lower_bound='1s'))
+      help=_TIMEOUT_HELP_GA
+      if track is not base.ReleaseTrack.ALPHA else _TIMEOUT_HELP_ALPHA,
+      type=_TIMEOUT_PARSER)
 
 
 def AddFunctionRetryFlag(parser):
@@ -253,109 +457,56 @@ def AddGen2Flag(parser, track):
     )
 
 
-def ShouldUseGen2():
+@functools.lru_cache(maxsize=1)
+def _ShouldUseGen2Cached():
+  """Resolves the gen2/v2 properties once per process.
+
+  Each GetBool walks the whole property hierarchy (flag overrides,
+  environment, config files), and ShouldUseGen2 is consulted from several
+  call sites within a single command. Flag actions run before command
+  execution, so the resolved value is stable by the time it is first read;
+  anything that changes the properties afterwards (tests, mainly) must
+  call ShouldUseGen2.cache_clear().
+  """
   gen2 = properties.VALUES.functions.gen2.GetBool()
   v2 = properties.VALUES.functions.v2.GetBool()
   return gen2 if gen2 is not None else bool(v2)
 
 
-def _ShouldHideV2Flags(track):
-  return track is not base.ReleaseTrack.ALPHA
-
-
-def ShouldEnsureAllUsersInvoke(args):
-  if args.allow_unauthenticated:
-    return True
-  else:
-    return False
-
-
-def ShouldDenyAllUsersInvoke(args):
-  if (args.IsSpecified('allow_unauthenticated') and
-      not args.allow_unauthenticated):
-    return True
-  else:
-    return False
-
-
-def AddSourceFlag(parser):
-  """Add flag for specifying function source code to the parser."""
-  parser.add_argument(
-      '--source',
-      help="""\
-      Location of source code to deploy.
-
-      Location of the source can be one of the following three options:
-
-      * Source code in Google Cloud Storage (must be a `.zip` archive),
-      * Reference to source repository or,
-      * Local filesystem path (root directory of function source).
-
-      Note that, depending on your runtime type, Cloud Functions will look
-      for files with specific names for deployable functions. For Node.js,
-      these filenames are `index.js` or `function.js`. For Python, this is
-      `main.py`.
-
-      If you do not specify the `--source` flag:
-
-      * The current directory will be used for new function deployments.
-      * If the function was previously deployed using a local filesystem path,
-      then the function's source code will be updated using the current
-      directory.
-      * If the function was previously deployed using a Google Cloud Storage
-      location or a source repository, then the function's source code will not
-      be updated.
-
-      The value of the flag will be interpreted as a Cloud Storage location, if
-      it starts with `gs://`.
+def ShouldUseGen2():
+  return _ShouldUseGen2Cached()
 
-      The value will be interpreted as a reference to a source repository, if it
-      starts with `https://`.
 
-      Otherwise, it will be interpreted as the local filesystem path. When
-      deploying source from the local filesystem, this command skips files
-      specified in the `.gcloudignore` file (see `gcloud topic gcloudignore` for
-      more information). If the `.gcloudignore` file doesn't exist, the command
-      will try to create it.
+ShouldUseGen2.cache_clear = _ShouldUseGen2Cached.cache_clear
 
-      The minimal source repository URL is:
-      `https://source.developers.google.com/projects/${PROJECT}/repos/${REPO}`
 
-      By using the URL above, sources from the root directory of the
-      repository on the revision tagged `master` will be used.
+# _ShouldHideV2Flags runs for every v2 flag of every parser build; a
+# lookup table keyed by the track enum keeps it a single dict probe.
+_HIDE_V2_FLAGS = types.MappingProxyType({base.ReleaseTrack.ALPHA: False})
 
-      If you want to deploy from a revision different from `master`, append one
-      of the following three sources to the URL:
 
-      * `/revisions/${REVISION}`,
-      * `/moveable-aliases/${MOVEABLE_ALIAS}`,
-      * `/fixed-aliases/${FIXED_ALIAS}`.
+def _ShouldHideV2Flags(track):
+  return _HIDE_V2_FLAGS.get(track, True)
 
-      If you'd like to deploy sources from a directory different from the root,
-      you must specify a revision, a moveable alias, or a fixed alias, as above,
-      and append `/paths/${PATH_TO_SOURCES_DIRECTORY}` to the URL.
 
-      Overall, the URL should match the following regular expression:
+def ShouldEnsureAllUsersInvoke(args):
+  return bool(args.allow_unauthenticated)
 
-      ```
-      ^https://source\\.developers\\.google\\.com/projects/
-      (?<accountId>[^/]+)/repos/(?<repoName>[^/]+)
-      (((/revisions/(?<commit>[^/]+))|(/moveable-aliases/(?<branch>[^/]+))|
-      (/fixed-aliases/(?<tag>[^/]+)))(/paths/(?<path>.*))?)?$
-      ```
 
-      An example of a validly formatted source repository URL is:
+def ShouldDenyAllUsersInvoke(args):
+  return (args.IsSpecified('allow_unauthenticated') and
+          not args.allow_unauthenticated)
 
-      ```
-      https://source.developers.google.com/projects/123456789/repos/testrepo/
-      moveable-aliases/alternate-branch/paths/path-to=source
-      ```
 
-      """)
+def AddSourceFlag(parser):
+  """Add flag for specifying function source code to the parser."""
+  parser.add_argument('--source', help=_SOURCE_HELP)
 
 
 def AddStageBucketFlag(parser):
   """Add flag for specifying stage bucket to the parser."""
+  from googlecloudsdk.api_lib.functions.v1 import util as api_util
+
   parser.add_argument(
       '--stage-bucket',
       help=('When deploying a function from a local directory, this flag\'s '
@@ -371,43 +522,31 @@ def AddStageBucketFlag(parser):
 
 
 def AddRuntimeFlag(parser):
-  # TODO(b/110148388): Do not hardcode list of choices in the help text.
-  parser.add_argument(
-      '--runtime',
-      help="""\
-          Runtime in which to run the function.
+  parser.add_argument('--runtime', help=_RUNTIME_HELP)
 
-          Required when deploying a new function; optional when updating
-          an existing function.
 
-          Choices:
+def _AddMutexFlagWithClear(parser, flag, help_main, help_clear, **main_kwargs):
+  """Adds a flag and its --clear-* counterpart as a mutex group.
 
-          - `nodejs10`: Node.js 10
-          - `nodejs12`: Node.js 12
-          - `nodejs14`: Node.js 14
-          - `nodejs16`: Node.js 16 (preview)
-          - `php74`: PHP 7.4
-          - `python37`: Python 3.7
-          - `python38`: Python 3.8
-          - `python39`: Python 3.9
-          - `go111`: Go 1.11
-          - `go113`: Go 1.13
-          - `go116`: Go 1.16 (preview)
-          - `java11`: Java 11
-          - `dotnet3`: .NET Framework 3
-          - `ruby26`: Ruby 2.6
-          - `ruby27`: Ruby 2.7
-          - `nodejs6`: Node.js 6 (deprecated)
-          - `nodejs8`: Node.js 8 (deprecated)
-          """)
+  Args:
+    parser: the argparse parser for the command.
+    flag: str, the main flag name, including the leading dashes.
+    help_main: str, help text for the main flag.
+    help_clear: str, help text for the clear flag.
+    **main_kwargs: additional add_argument kwargs for the main flag.
+  """
+  mutex_group = parser.add_group(mutex=True)
+  mutex_group.add_argument(flag, help=help_main, **main_kwargs)
+  mutex_group.add_argument(
+      '--clear-' + flag[2:], action='store_true', help=help_clear)
 
 
 def AddVPCConnectorMutexGroup(parser):
   """Add flag for specifying VPC connector to the parser."""
-  mutex_group = parser.add_group(mutex=True)
-  mutex_group.add_argument(
+  _AddMutexFlagWithClear(
+      parser,
       '--vpc-connector',
-      help="""\
+      """\
         The VPC Access connector that the function can connect to. It can be
         either the fully-qualified URI, or the short name of the VPC Access
         connector resource. If the short name is used, the connector must
@@ -415,32 +554,26 @@ def AddVPCConnectorMutexGroup(parser):
         `projects/${PROJECT}/locations/${LOCATION}/connectors/${CONNECTOR}`
         or `${CONNECTOR}`, where `${CONNECTOR}` is the short name of the VPC
         Access connector.
-      """)
-  mutex_group.add_argument(
-      '--clear-vpc-connector',
-      action='store_true',
-      help="""\
+      """,
+      """\
         Clears the VPC connector field.
       """)
 
 
 def AddBuildWorkerPoolMutexGroup(parser):
   """Add flag for specifying Build Worker Pool to the parser."""
-  mutex_group = parser.add_group(mutex=True)
-  mutex_group.add_argument(
+  _AddMutexFlagWithClear(
+      parser,
       '--build-worker-pool',
-      help="""\
+      """\
         Name of the Cloud Build Custom Worker Pool that should be used to build
         the function. The format of this field is
         `projects/${PROJECT}/locations/${LOCATION}/workerPools/${WORKERPOOL}`
         where ${PROJECT} is the project id and ${LOCATION} is the location where
         the worker pool is defined and ${WORKERPOOL} is the short name of the
         worker pool.
-      """)
-  mutex_group.add_argument(
-      '--clear-build-worker-pool',
-      action='store_true',
-      help="""\
+      """,
+      """\
         Clears the Cloud Build Custom Worker Pool field.
       """)
 
@@ -461,38 +594,32 @@ def AddEntryPointFlag(parser):
 
 def AddMaxInstancesFlag(parser):
   """Add flag for specifying the max instances for a function."""
-  mutex_group = parser.add_group(mutex=True)
-  mutex_group.add_argument(
+  _AddMutexFlagWithClear(
+      parser,
       '--max-instances',
-      type=arg_parsers.BoundedInt(lower_bound=1),
-      help="""\
+      """\
         Sets the maximum number of instances for the function. A function
         execution that would exceed max-instances times out.
-      """)
-  mutex_group.add_argument(
-      '--clear-max-instances',
-      action='store_true',
-      help="""\
+      """,
+      """\
         Clears the maximum instances setting for the function.
-      """)
+      """,
+      type=_POSITIVE_INT_PARSER)
 
 
 def AddMinInstancesFlag(parser):
   """Add flag for specifying the min instances for a function."""
-  mutex_group = parser.add_group(mutex=True)
-  mutex_group.add_argument(
+  _AddMutexFlagWithClear(
+      parser,
       '--min-instances',
-      type=arg_parsers.BoundedInt(lower_bound=0),
-      help="""\
+      """\
         Sets the minimum number of instances for the function. This is helpful
         for reducing cold start times. Defaults to zero.
-      """)
-  mutex_group.add_argument(
-      '--clear-min-instances',
-      action='store_true',
-      help="""\
+      """,
+      """\
         Clears the minimum instances setting for the function.
-      """)
+      """,
+      type=_NONNEGATIVE_INT_PARSER)
 
 
 def AddTriggerFlagGroup(parser, track=None):
@@ -502,19 +629,12 @@ def AddTriggerFlagGroup(parser, track=None):
     parser: the argparse parser for the command.
     track: base.ReleaseTrack, calliope release track.
   """
-  trigger_flags = ['--trigger-topic', '--trigger-bucket', '--trigger-http']
-  gen2_tracks = [base.ReleaseTrack.ALPHA, base.ReleaseTrack.BETA]
-  if not _ShouldHideV2Flags(track):
-    trigger_flags.append('--trigger-event-filters')
-  formatted_trigger_flags = ', '.join(['`{}`'.format(f) for f in trigger_flags])
+  from googlecloudsdk.api_lib.functions.v1 import util as api_util
 
+  gen2_tracks = (base.ReleaseTrack.ALPHA, base.ReleaseTrack.BETA)
   trigger_group = parser.add_mutually_exclusive_group(
-      help=('If you don\'t specify a trigger when deploying an update to an '
-            'existing function it will keep its current trigger. '
-            'You must specify {formatted_trigger_flags} or '
-            '(`--trigger-event` AND `--trigger-resource`) when deploying a '
-            'new function.'.format(
-                formatted_trigger_flags=formatted_trigger_flags)))
+      help=_TRIGGER_GROUP_HELP if _ShouldHideV2Flags(track) else
+      _TRIGGER_GROUP_HELP_WITH_FILTERS)
   trigger_group.add_argument(
       '--trigger-topic',
       help=('Name of Pub/Sub topic. Every message published in this topic '
@@ -572,6 +692,12 @@ def AddTriggerFlagGroup(parser, track=None):
 
 
 class LocationsCompleter(completers.ListCommandCompleter):
+  """Completer for the function location and region arguments.
+
+  Call sites pass the class, not an instance: calliope's ArgumentCompleter
+  wrapper defers instantiation until a completion is actually requested, so
+  parser builds never pay for constructing one.
+  """
 
   def __init__(self, **kwargs):
     super(LocationsCompleter, self).__init__(
@@ -589,7 +715,15 @@ def AddRegionFlag(parser, help_text):
   )
 
 
+# The attribute configs and resource spec below never change after
+# construction and calliope treats them as shared descriptors, so their
+# factories are memoized rather than rebuilding the spec graph for every
+# function-related command's parser.
+@functools.lru_cache(maxsize=None)
 def RegionAttributeConfig():
+  from googlecloudsdk.calliope.concepts import concepts
+  from googlecloudsdk.calliope.concepts import deps
+
   return concepts.ResourceParameterAttributeConfig(
       name='region',
       help_text=(
@@ -614,7 +748,11 @@ def AddTriggerLocationFlag(parser, track):
   )
 
 
+@functools.lru_cache(maxsize=None)
 def FunctionAttributeConfig():
+  from googlecloudsdk.api_lib.functions.v1 import util as api_util
+  from googlecloudsdk.calliope.concepts import concepts
+
   return concepts.ResourceParameterAttributeConfig(
       name='function',
       help_text='The Cloud functon name.',
@@ -622,7 +760,10 @@ def FunctionAttributeConfig():
   )
 
 
+@functools.lru_cache(maxsize=None)
 def GetFunctionResourceSpec():
+  from googlecloudsdk.calliope.concepts import concepts
+
   return concepts.ResourceSpec(
       'cloudfunctions.projects.locations.functions',
       resource_name='function',
@@ -644,6 +785,8 @@ def AddFunctionResourceArg(parser, verb, positional=True):
     positional: bool, if True, means that the instance ID is a positional rather
       than a flag.
   """
+  from googlecloudsdk.command_lib.util.concepts import concept_parsers
+
   name = 'NAME' if positional else '--function'
   concept_parsers.ConceptParser.ForResource(
       name,
@@ -735,29 +878,28 @@ def AddIgnoreFileFlag(parser):
 
 
 def AddSignatureTypeFlag(parser, track):
-  base.ChoiceArgument(
+  parser.add_argument(
       '--signature-type',
       choices=SIGNATURE_TYPES,
+      type=_ChoiceValueType,
       hidden=_ShouldHideV2Flags(track),
-      help_str=(
+      help=(
           'The type of event signature for the function. `http` '
           'indicates that the function is triggered by HTTP requests. '
           '`event` indicates that the function consumes legacy events. '
           '`cloudevent` indicates that the function consumes events in '
           'the new CloudEvent format. This is only relevant when `--gen2` '
           'is provided.'),
-  ).AddToParser(parser)
+  )
 
 
 # Flags for CMEK
 def AddKMSKeyFlags(parser):
   """Adds flags for configuring the CMEK key."""
-  kmskey_group = parser.add_group(mutex=True)
-  kmskey_group.add_argument(
+  _AddMutexFlagWithClear(
+      parser,
       '--kms-key',
-      type=arg_parsers.RegexpValidator(_KMS_KEY_NAME_PATTERN,
-                                       _KMS_KEY_NAME_ERROR),
-      help="""\
+      """\
         Sets the user managed KMS crypto key used to encrypt the Cloud Function
         and its resources.
 
@@ -770,23 +912,19 @@ def AddKMSKeyFlags(parser):
         If this flag is set, then a Docker repository created in Artifact
         Registry must be specified using the `--docker-repository` flag and the
         repository must be encrypted using the `same` KMS key.
-      """)
-  kmskey_group.add_argument(
-      '--clear-kms-key',
-      action='store_true',
-      help="""\
+      """,
+      """\
         Clears the KMS crypto key used to encrypt the function.
-      """)
+      """,
+      type=_ValidateKMSKeyNameOrRaise)
 
 
 def AddDockerRepositoryFlags(parser):
   """Adds flags for configuring the Docker repository for Cloud Function."""
-  kmskey_group = parser.add_group(mutex=True)
-  kmskey_group.add_argument(
+  _AddMutexFlagWithClear(
+      parser,
       '--docker-repository',
-      type=arg_parsers.RegexpValidator(_DOCKER_REPOSITORY_NAME_PATTERN,
-                                       _DOCKER_REPOSITORY_NAME_ERROR),
-      help="""\
+      """\
         Sets the Docker repository to be used for storing the Cloud Function's
         Docker images while the function is being deployed. `DOCKER_REPOSITORY`
         must be an Artifact Registry Docker repository present in the `same`
@@ -796,10 +934,8 @@ def AddDockerRepositoryFlags(parser):
         `projects/${PROJECT}/locations/${LOCATION}/repositories/${REPOSITORY}`
         where ${PROJECT} is the project, ${LOCATION} is the location of the
         repository and ${REPOSITORY} is a valid repository ID.
-      """)
-  kmskey_group.add_argument(
-      '--clear-docker-repository',
-      action='store_true',
-      help="""\
+      """,
+      """\
         Clears the Docker repository configuration of the function.
-      """)
+      """,
+      type=_ValidateDockerRepositoryNameOrRaise)
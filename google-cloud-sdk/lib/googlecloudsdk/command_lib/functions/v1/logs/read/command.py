@@ -90,7 +90,7 @@ def _Run(args):
     row = {'log': message}
     if entry.severity:
       severity = six.text_type(entry.severity)
-      if severity in flags.SEVERITIES:
+      if severity in flags.SEVERITIES_SET:
         # Use short form (first letter) for expected severities.
         row['level'] = severity[0]
       else:
@@ -15,10 +15,6 @@
 
 """List regions available to Google Cloud Functions."""
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import unicode_literals
-
 from apitools.base.py import exceptions as api_exceptions
 from apitools.base.py import list_pager
 
@@ -36,6 +32,7 @@ def Run(args):
       service=client.projects_locations,
       request=_BuildRequest(),
       field='locations',
+      batch_size=100,
       batch_size_attribute='pageSize')
   try:
     for item in list_generator:
@@ -45,8 +42,17 @@ def Run(args):
     exceptions.reraise(base_exceptions.HttpException(msg))
 
 
+# The Cloud Functions messages module, resolved once on first use.
+_messages = None
+
+
 def _BuildRequest():
-  messages = util.GetApiMessagesModule()
+  global _messages
+  if _messages is None:
+    _messages = util.GetApiMessagesModule()
+  # The project is re-read on every build: it can change between invocations
+  # in long-lived interactive sessions, so only the dotted property walk is
+  # collapsed into a local here.
   project = properties.VALUES.core.project.GetOrFail()
-  return messages.CloudfunctionsProjectsLocationsListRequest(
+  return _messages.CloudfunctionsProjectsLocationsListRequest(
       name='projects/' + project)
@@ -14,11 +14,8 @@
 # limitations under the License.
 """A library that is used to support Cloud Pub/Sub Lite commands."""
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
+import functools
+import re
 import sys
 
 from googlecloudsdk.api_lib.util import apis
@@ -27,8 +24,6 @@ from googlecloudsdk.core import exceptions
 from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
 from googlecloudsdk.core.console import console_io
-import six
-from six.moves.urllib.parse import urlparse
 
 # Resource path constants
 PROJECTS_RESOURCE_PATH = 'projects/'
@@ -37,6 +32,9 @@ RESERVATIONS_RESOURCE_PATH = 'reservations/'
 TOPICS_RESOURCE_PATH = 'topics/'
 SUBSCRIPTIONS_RESOURCE_PATH = 'subscriptions/'
 
+# Matches the project and location components of a resource path.
+_RESOURCE_RE = re.compile(r'projects/([^/]+)/locations/([^/]+)')
+
 
 class UnexpectedResourceField(exceptions.Error):
   """Error for having and unknown resource field."""
@@ -60,14 +58,21 @@ class InvalidSeekTarget(exceptions.Error):
   """Error for specifying an invalid seek target."""
 
 
+# The Pub/Sub Lite messages module, resolved once on first use.
+_psl_messages = None
+
+
 def PubsubLiteMessages():
   """Returns the Pub/Sub Lite v1 messages module."""
-  return apis.GetMessagesModule('pubsublite', 'v1')
+  global _psl_messages
+  if _psl_messages is None:
+    _psl_messages = apis.GetMessagesModule('pubsublite', 'v1')
+  return _psl_messages
 
 
 def DurationToSeconds(duration):
   """Convert Duration object to total seconds for backend compatibility."""
-  return six.text_type(int(duration.total_seconds)) + 's'
+  return str(int(duration.total_seconds)) + 's'
 
 
 def StripPathFromUrl(url):
@@ -81,8 +86,13 @@ def StripPathFromUrl(url):
   Returns:
     The url with the path removed. Example: `https://base.url.com/`.
   """
-  parsed = urlparse(url)
-  return parsed.scheme + '://' + parsed.netloc + '/'
+  # The endpoint urls handled here always have the simple
+  # `scheme://netloc/path` shape, so a find() recovers the prefix without
+  # urlparse's full grammar or its ParseResult allocation.
+  path_start = url.find('/', url.find('://') + 3)
+  if path_start == -1:
+    return url + '/'
+  return url[:path_start] + '/'
 
 
 def DeriveRegionFromLocation(location):
@@ -111,29 +121,49 @@ def DeriveRegionFromEndpoint(endpoint):
   Returns:
     The str region if it exists, otherwise None.
   """
-  parsed = urlparse(endpoint)
-  dash_splits = parsed.netloc.split('-')
-  if len(dash_splits) > 2:
-    return dash_splits[0] + '-' + dash_splits[1]
-  else:
+  netloc_start = endpoint.find('://') + 3
+  netloc_end = endpoint.find('/', netloc_start)
+  if netloc_end == -1:
+    netloc_end = len(endpoint)
+  netloc = endpoint[netloc_start:netloc_end]
+  # The region, when present, spans the first two dash-separated components.
+  # Locating the second dash directly avoids the list that split('-') would
+  # allocate just to look at its first two entries.
+  first_dash = netloc.find('-')
+  if first_dash == -1:
+    return None
+  second_dash = netloc.find('-', first_dash + 1)
+  if second_dash == -1:
     return None
+  return netloc[:second_dash]
 
 
 def CreateRegionalEndpoint(region, url):
   """Returns a new endpoint string with the defined `region` prefixed to the netlocation."""
-  url_parts = url.split('://')
-  url_scheme = url_parts[0]
-  return url_scheme + '://' + region + '-' + url_parts[1]
+  # One replace() pass instead of split plus reassembly.
+  return url.replace('://', '://' + region + '-', 1)
 
 
 def RemoveRegionFromEndpoint(endpoint):
   """Returns a new endpoint string stripped of the region if one exists."""
   region = DeriveRegionFromEndpoint(endpoint)
   if region:
-    endpoint = endpoint.replace(region + '-', '')
+    # The region is always the leading netloc component, so it can be cut
+    # out with one slice concatenation instead of a full replace() scan.
+    region_start = endpoint.find('://') + 3
+    endpoint = (
+        endpoint[:region_start] + endpoint[region_start + len(region) + 1:])
   return endpoint
 
 
+# Maps a request type to the name of its resource field, discovered on first
+# sight. The message type fully determines which field exists, so repeat
+# requests skip the hasattr probes below.
+_RESOURCE_FIELD_CACHE = {}
+# Sentinel recording that a request type has no recognized resource field.
+_UNKNOWN_RESOURCE_FIELD = object()
+
+
 def GetResourceInfo(request):
   """Returns a tuple of the resource and resource name from the `request`.
 
@@ -146,23 +176,25 @@ def GetResourceInfo(request):
   Raises:
     UnexpectedResourceField: The `request` had a unsupported resource.
   """
-  resource = ''
-  resource_name = ''
-
-  if hasattr(request, 'parent'):
-    resource = request.parent
-    resource_name = 'parent'
-  elif hasattr(request, 'name'):
-    resource = request.name
-    resource_name = 'name'
-  elif hasattr(request, 'subscription'):
-    resource = request.subscription
-    resource_name = 'subscription'
-  else:
+  request_type = type(request)
+  resource_name = _RESOURCE_FIELD_CACHE.get(request_type)
+
+  if resource_name is None:
+    if hasattr(request, 'parent'):
+      resource_name = 'parent'
+    elif hasattr(request, 'name'):
+      resource_name = 'name'
+    elif hasattr(request, 'subscription'):
+      resource_name = 'subscription'
+    else:
+      resource_name = _UNKNOWN_RESOURCE_FIELD
+    _RESOURCE_FIELD_CACHE[request_type] = resource_name
+
+  if resource_name is _UNKNOWN_RESOURCE_FIELD:
     raise UnexpectedResourceField(
         'The resource specified for this command is unknown!')
 
-  return resource, resource_name
+  return getattr(request, resource_name), resource_name
 
 
 def DeriveLocationFromResource(resource):
@@ -181,6 +213,50 @@ def DeriveProjectFromResource(resource):
   return project
 
 
+def _RegionOfLocation(location):
+  """Returns the location truncated at its second dash, if it has one."""
+  second_dash = location.find('-', location.find('-') + 1)
+  return location if second_dash == -1 else location[:second_dash]
+
+
+def _ParseResourceParts(resource):
+  """Returns the (project, location, region) from a resource string.
+
+  A single pass of the precompiled pattern extracts the project and location
+  together, where the separate Derive* helpers each rescan the resource. The
+  region is the location truncated at its second dash, or the location itself
+  if it has fewer than two dashes.
+
+  Args:
+    resource: A str of the form `projects/<project>/locations/<location>/...`.
+
+  Returns:
+    A (project, location, region) tuple of strs.
+  """
+  match = _RESOURCE_RE.search(resource)
+  project, location = match.group(1), match.group(2)
+  return project, location, _RegionOfLocation(location)
+
+
+def _AnalyzeResource(resource):
+  """Trims a resource to its `projects/` suffix and scans it once.
+
+  Fuses the work that ParseResource, OverrideProjectIdToProjectNumber and
+  OverrideEndpointWithRegion would each redo on the same string when chained.
+
+  Args:
+    resource: A str resource path containing a `projects/` component.
+
+  Returns:
+    A (trimmed_resource, match, region) tuple: the resource starting at its
+    last `projects/` component, the _RESOURCE_RE match against it (so callers
+    can splice fields in by offset), and the region of its location.
+  """
+  trimmed = resource[resource.rindex(PROJECTS_RESOURCE_PATH):]
+  match = _RESOURCE_RE.search(trimmed)
+  return trimmed, match, _RegionOfLocation(match.group(2))
+
+
 def ParseResource(request):
   """Returns an updated `request` with the resource path parsed."""
   resource, resource_name = GetResourceInfo(request)
@@ -190,30 +266,78 @@ def ParseResource(request):
   return request
 
 
+def _SplitEndpoint(url):
+  """Returns the (scheme, netloc) of `url` with any region prefix removed.
+
+  One pass over the url replaces the StripPathFromUrl,
+  DeriveRegionFromEndpoint and RemoveRegionFromEndpoint chain, which scanned
+  the same characters three times. A region left by a previous override (as
+  happens when scenario tests run several commands in one process) is
+  stripped while the netloc bounds are located.
+
+  Args:
+    url: A str of the form `scheme://<region->netloc/path`.
+
+  Returns:
+    A (scheme, netloc) tuple of strs, the netloc without a region prefix.
+  """
+  scheme_end = url.find('://')
+  netloc_start = scheme_end + 3
+  netloc_end = url.find('/', netloc_start)
+  if netloc_end == -1:
+    netloc_end = len(url)
+  first_dash = url.find('-', netloc_start, netloc_end)
+  if first_dash != -1:
+    second_dash = url.find('-', first_dash + 1, netloc_end)
+    if second_dash != -1:
+      netloc_start = second_dash + 1
+  return url[:scheme_end], url[netloc_start:netloc_end]
+
+
 def OverrideEndpointWithRegion(request, url):
   """Sets the pubsublite endpoint override to include the region."""
   resource, _ = GetResourceInfo(request)
-  region = DeriveRegionFromLocation(DeriveLocationFromResource(resource))
+  _, _, region = _ParseResourceParts(resource)
+
+  scheme, netloc = _SplitEndpoint(url)
+  properties.VALUES.api_endpoint_overrides.pubsublite.Set(
+      scheme + '://' + region + '-' + netloc + '/')
 
-  endpoint = StripPathFromUrl(url)
 
-  # Remove any region from the endpoint in case it was previously set.
-  # Specifically this effects scenario tests where multiple tests are run in a
-  # single instance.
-  endpoint = RemoveRegionFromEndpoint(endpoint)
+# Lazily created Cloud Resource Manager client and messages module, shared
+# across project-number lookups.
+_crm_client = None
+_crm_messages = None
 
-  regional_endpoint = CreateRegionalEndpoint(region, endpoint)
-  properties.VALUES.api_endpoint_overrides.pubsublite.Set(regional_endpoint)
 
+def _CloudResourceManagerClient():
+  """Returns the Cloud Resource Manager client, creating it on first use."""
+  global _crm_client
+  if _crm_client is None:
+    _crm_client = apis.GetClientInstance('cloudresourcemanager', 'v1')
+  return _crm_client
 
+
+def _CloudResourceManagerMessages():
+  """Returns the Cloud Resource Manager messages module, created on first use."""
+  global _crm_messages
+  if _crm_messages is None:
+    _crm_messages = apis.GetMessagesModule('cloudresourcemanager', 'v1')
+  return _crm_messages
+
+
+@functools.lru_cache(maxsize=128)
 def ProjectIdToProjectNumber(project_id):
-  """Returns the Cloud project number associated with the `project_id`."""
-  crm_message_module = apis.GetMessagesModule('cloudresourcemanager', 'v1')
-  resource_manager = apis.GetClientInstance('cloudresourcemanager', 'v1')
+  """Returns the Cloud project number associated with the `project_id`.
 
-  req = crm_message_module.CloudresourcemanagerProjectsGetRequest(
+  The mapping is immutable for the life of a project, so results are
+  memoized to avoid repeating the Resource Manager round-trip on every
+  admin request. Failed lookups raise and are not cached, so transient
+  errors don't poison later retries.
+  """
+  req = _CloudResourceManagerMessages().CloudresourcemanagerProjectsGetRequest(
       projectId=project_id)
-  project = resource_manager.projects.Get(req)
+  project = _CloudResourceManagerClient().projects.Get(req)
 
   return project.projectNumber
 
@@ -221,10 +345,14 @@ def ProjectIdToProjectNumber(project_id):
 def OverrideProjectIdToProjectNumber(request):
   """Returns an updated `request` with the Cloud project number."""
   resource, resource_name = GetResourceInfo(request)
-  project_id = DeriveProjectFromResource(resource)
-  project_number = ProjectIdToProjectNumber(project_id)
-  setattr(request, resource_name,
-          resource.replace(project_id, six.text_type(project_number)))
+  match = _RESOURCE_RE.search(resource)
+  project_number = ProjectIdToProjectNumber(match.group(1))
+  # The project id sits at a known offset in the resource, so splice the
+  # number in with one slice concatenation. replace() would rescan the whole
+  # string and could also rewrite a coincidental match later in the path.
+  setattr(
+      request, resource_name, resource[:match.start(1)] + str(project_number) +
+      resource[match.end(1):])
 
   return request
 
@@ -234,9 +362,19 @@ def UpdateAdminRequest(resource_ref, args, request):
   # Unused resource reference.
   del args
 
-  request = ParseResource(request)
-  request = OverrideProjectIdToProjectNumber(request)
-  OverrideEndpointWithRegion(request, resource_ref.SelfLink())
+  # A single GetResourceInfo and resource scan replace the chained
+  # ParseResource / OverrideProjectIdToProjectNumber /
+  # OverrideEndpointWithRegion hooks, which each re-derive the same fields.
+  resource, resource_name = GetResourceInfo(request)
+  trimmed, match, region = _AnalyzeResource(resource)
+  project_number = ProjectIdToProjectNumber(match.group(1))
+  setattr(
+      request, resource_name, trimmed[:match.start(1)] + str(project_number) +
+      trimmed[match.end(1):])
+
+  scheme, netloc = _SplitEndpoint(resource_ref.SelfLink())
+  properties.VALUES.api_endpoint_overrides.pubsublite.Set(
+      scheme + '://' + region + '-' + netloc + '/')
 
   return request
 
@@ -255,20 +393,16 @@ def UpdateCommitCursorRequest(resource_ref, args, request):
   return request
 
 
-def _HasReservation(topic):
-  """Returns whether the topic has a reservation set."""
-  if topic.reservationConfig is None:
-    return False
-  return bool(topic.reservationConfig.throughputReservation)
-
-
 def AddTopicDefaultsWithoutReservation(resource_ref, args, request):
   """Adds the default values for topic throughput fields with no reservation."""
   # Unused resource reference and arguments.
   del resource_ref, args
 
   topic = request.topic
-  if not _HasReservation(topic):
+  # Attribute access on apitools messages goes through a __getattr__ shim, so
+  # read reservationConfig once for both reservation checks.
+  reservation_config = topic.reservationConfig
+  if reservation_config is None or not reservation_config.throughputReservation:
     if topic.partitionConfig is None:
       topic.partitionConfig = {}
     if topic.partitionConfig.capacity is None:
@@ -287,18 +421,16 @@ def AddTopicReservationResource(resource_ref, args, request):
   # Unused resource reference and arguments.
   del resource_ref, args
 
-  topic = request.topic
-  if not _HasReservation(topic):
+  reservation_config = request.topic.reservationConfig
+  if reservation_config is None or not reservation_config.throughputReservation:
     return request
 
   resource, _ = GetResourceInfo(request)
-  project = DeriveProjectFromResource(resource)
-  region = DeriveRegionFromLocation(DeriveLocationFromResource(resource))
-  reservation = topic.reservationConfig.throughputReservation
-  request.topic.reservationConfig.throughputReservation = (
-      '{}{}/{}{}/{}{}'.format(
-          PROJECTS_RESOURCE_PATH, project, LOCATIONS_RESOURCE_PATH, region,
-          RESERVATIONS_RESOURCE_PATH, reservation))
+  project, _, region = _ParseResourceParts(resource)
+  # Concatenation skips str.format's per-call template parse.
+  reservation_config.throughputReservation = (
+      'projects/' + project + '/locations/' + region + '/reservations/' +
+      reservation_config.throughputReservation)
 
   return request
 
@@ -309,8 +441,8 @@ def AddSubscriptionTopicResource(resource_ref, args, request):
   del resource_ref, args
 
   resource, _ = GetResourceInfo(request)
-  request.subscription.topic = '{}/{}{}'.format(resource, TOPICS_RESOURCE_PATH,
-                                                request.subscription.topic)
+  request.subscription.topic = (
+      resource + '/topics/' + request.subscription.topic)
 
   return request
 
@@ -392,19 +524,18 @@ def UpdateListOperationsFilter(resource_ref, args, request):
     return request
 
   # Otherwise build the filter if the --subscription and/or --done flags are
-  # specified. The server will handle filtering.
+  # specified. The server will handle filtering. Collect the clauses and
+  # write request.filter once, rather than appending to it branch by branch.
+  clauses = []
   if args.subscription:
     # Note: This relies on project ids replaced with project numbers until
     # b/194764731 is fixed.
-    request.filter = 'target={}/{}{}'.format(request.name,
-                                             SUBSCRIPTIONS_RESOURCE_PATH,
-                                             args.subscription)
+    clauses.append(
+        'target=' + request.name + '/subscriptions/' + args.subscription)
   if args.done:
-    if request.filter:
-      request.filter += ' AND '
-    else:
-      request.filter = ''
-    request.filter += 'done={}'.format(args.done)
+    clauses.append('done=' + str(args.done))
+  if clauses:
+    request.filter = ' AND '.join(clauses)
   return request
 
 
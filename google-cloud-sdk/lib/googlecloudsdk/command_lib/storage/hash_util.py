@@ -25,10 +25,14 @@ import os
 from googlecloudsdk.command_lib import info_holder
 from googlecloudsdk.command_lib.storage import errors
 from googlecloudsdk.command_lib.util import crc32c
-from googlecloudsdk.core.updater import installers
 from googlecloudsdk.core.util import hashing
 
 
+# Reading large chunks amortizes the per-call overhead of hash updates
+# while still avoiding holding whole files in memory.
+_HASH_BUFFER_SIZE = 1024 * 1024  # 1 MiB.
+
+
 class HashAlgorithm(enum.Enum):
   """Algorithms available for hashing data."""
 
@@ -71,15 +75,18 @@ def get_hash_from_file_stream(file_stream,
 
   if start:
     file_stream.seek(start)
+    position = start
+  else:
+    position = file_stream.tell()
   while True:
-    if stop and file_stream.tell() >= stop:
+    if stop and position >= stop:
       break
 
     # Avoids holding all of file in memory at once.
-    if stop is None or file_stream.tell() + installers.WRITE_BUFFER_SIZE < stop:
-      bytes_to_read = installers.WRITE_BUFFER_SIZE
+    if stop is None or position + _HASH_BUFFER_SIZE < stop:
+      bytes_to_read = _HASH_BUFFER_SIZE
     else:
-      bytes_to_read = stop - file_stream.tell()
+      bytes_to_read = stop - position
 
     data = file_stream.read(bytes_to_read)
     if not data:
@@ -88,6 +95,10 @@ def get_hash_from_file_stream(file_stream,
     if isinstance(data, str):
       # read() can return strings or bytes. Hash objects need bytes.
       data = data.encode('utf-8')
+      # Character and byte counts can differ, so ask the stream directly.
+      position = file_stream.tell()
+    else:
+      position += len(data)
     # Compresses each piece of added data.
     hash_object.update(data)
 
@@ -67,9 +67,18 @@ def create_file_if_needed(source_resource, destination_resource):
     return
 
   with files.BinaryFileWriter(
-      file_path, create_path=True, mode=files.BinaryFileWriterMode.TRUNCATE):
+      file_path, create_path=True,
+      mode=files.BinaryFileWriterMode.TRUNCATE) as file_writer:
     # Wipe or create file.
-    pass
+    if source_resource.size and hasattr(os, 'posix_fallocate'):
+      # Reserving the full size up front lets the filesystem allocate the
+      # blocks once, instead of extending the file as each component writes
+      # to its slice.
+      try:
+        os.posix_fallocate(file_writer.fileno(), 0, source_resource.size)
+      except OSError:
+        # Preallocation is an optimization; not all filesystems support it.
+        pass
 
 
 def get_temporary_component_resource(source_resource, destination_resource,
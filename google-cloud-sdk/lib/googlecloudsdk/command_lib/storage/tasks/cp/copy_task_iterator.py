@@ -19,7 +19,12 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
+import concurrent.futures
+import logging
 import os
+import sys
+import time
 
 from googlecloudsdk.command_lib.storage import errors
 from googlecloudsdk.command_lib.storage import plurality_checkable_iterator
@@ -28,11 +33,62 @@ from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage import wildcard_iterator
 from googlecloudsdk.command_lib.storage.resources import resource_reference
 from googlecloudsdk.command_lib.storage.tasks.cp import copy_task_factory
+from googlecloudsdk.core import exceptions as core_exceptions
 from googlecloudsdk.core import log
 
 
 _RELATIVE_PATH_SYMBOLS = frozenset(['.', '..'])
 
+# Thread pool size for prefetching file sizes, and the cap on outstanding
+# lookups so an unbounded source listing cannot queue unbounded futures.
+_MAX_SIZE_PREFETCH_WORKERS = 8
+_MAX_OUTSTANDING_SIZE_LOOKUPS = 64
+
+# Per-source status messages are batched into single writes so that large
+# transfers do not pay one stderr flush per copied file.
+_STATUS_MESSAGE_BATCH_SIZE = 64
+_STATUS_MESSAGE_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Source and destination delimiters can only diverge when the local
+# filesystem delimiter is not '/', i.e. on Windows. Checking once at import
+# lets the recursion-suffix path skip per-child delimiter comparisons.
+_PLATFORM_USES_POSIX_DELIMITERS = os.sep == '/'
+
+
+def _peek_two(iterator):
+  """Buffers up to two items from an iterator to check its plurality.
+
+  Exceptions the iterator raises while probing are buffered the same way
+  PluralityCheckableIterator buffers them, so they count towards plurality
+  and surface when their position in the iteration is reached.
+
+  Args:
+    iterator: An iterator to probe.
+
+  Returns:
+    List of up to two (item, exception_info) pairs where exactly one element
+    of each pair is not None.
+  """
+  buffered = []
+  while len(buffered) < 2:
+    try:
+      buffered.append((next(iterator), None))
+    except StopIteration:
+      break
+    except Exception as e:  # pylint: disable=broad-except
+      buffered.append((None, (e, sys.exc_info()[2])))
+  return buffered
+
+
+def _yield_buffered_then_rest(buffered, iterator):
+  """Yields items buffered by _peek_two, then the rest of the iterator."""
+  for item, exception_info in buffered:
+    if exception_info:
+      core_exceptions.reraise(exception_info[0], tb=exception_info[1])
+    yield item
+  for item in iterator:
+    yield item
+
 
 def _expand_destination_wildcards(destination_string):
   """Expands destination wildcards.
@@ -177,10 +233,13 @@ class CopyTaskIterator:
         workload from this iterator.
       user_request_args (UserRequestArgs|None): Values for RequestConfig.
     """
-    self._source_name_iterator = (
-        plurality_checkable_iterator.PluralityCheckableIterator(
-            source_name_iterator))
-    self._multiple_sources = self._source_name_iterator.is_plural()
+    # Probing plurality with a two-item buffer avoids wrapping the whole
+    # iteration in PluralityCheckableIterator's per-item buffer management.
+    raw_source_iterator = iter(source_name_iterator)
+    buffered_sources = _peek_two(raw_source_iterator)
+    self._source_name_iterator = _yield_buffered_then_rest(
+        buffered_sources, raw_source_iterator)
+    self._multiple_sources = len(buffered_sources) > 1
     self._do_not_decompress = do_not_decompress
     self._custom_md5_digest = custom_md5_digest
     self._task_status_queue = task_status_queue
@@ -188,8 +247,16 @@ class CopyTaskIterator:
 
     self._total_file_count = 0
     self._total_size = 0
+    # Maps an expanded source URL to the prefix stripped from its children
+    # during recursion; every child of the same parent shares the prefix.
+    self._source_prefix_to_ignore_cache = {}
 
     self._raw_destination = _get_raw_destination(destination_string)
+    # The destination cannot change mid-iteration, so the container check
+    # (a stat call for file URLs) runs once here rather than per source.
+    self._raw_destination_is_container = _destination_is_container(
+        self._raw_destination)
+    self._destination_validated_for_recursion = self._multiple_sources
     if self._multiple_sources:
       self._raise_if_destination_is_file_url_and_not_a_directory()
 
@@ -199,18 +266,20 @@ class CopyTaskIterator:
 
   def _raise_if_destination_is_file_url_and_not_a_directory(self):
     if (isinstance(self._raw_destination.storage_url, storage_url.FileUrl) and
-        not _destination_is_container(self._raw_destination)):
+        not self._raw_destination_is_container):
       raise errors.InvalidUrlError(
           'Destination URL must name an existing directory.'
           ' Provided: {}.'.format(
               self._raw_destination.storage_url.object_name))
 
-  def _update_workload_estimation(self, resource):
+  def _update_workload_estimation(self, resource, size_future=None):
     """Updates total_file_count and total_size.
 
     Args:
       resource (resource_reference.Resource): Any type of resource. Parse to
         help estimate total workload.
+      size_future (concurrent.futures.Future|None): Holds the prefetched disk
+        size of a file resource.
     """
     if self._total_file_count == -1 or self._total_size == -1:
       # -1 is signal that data is corrupt and not worth tracking.
@@ -219,7 +288,10 @@ class CopyTaskIterator:
       if resource.is_container():
         return
       if isinstance(resource, resource_reference.FileObjectResource):
-        size = os.path.getsize(resource.storage_url.object_name)
+        if size_future is not None:
+          size = size_future.result()
+        else:
+          size = os.path.getsize(resource.storage_url.object_name)
       elif (isinstance(resource, resource_reference.ObjectResource) and
             resource.size is not None):
         size = resource.size
@@ -233,47 +305,131 @@ class CopyTaskIterator:
       self._total_file_count += 1
       self._total_size += size
 
-  def __iter__(self):
-    for source in self._source_name_iterator:
+  def _iter_sources_with_prefetched_sizes(self):
+    """Yields (source, size_future) pairs with file stats run in background.
+
+    Workload estimation needs one stat call per file source. Submitting the
+    lookups to a small thread pool ahead of the consumer overlaps the
+    syscalls with task creation instead of serializing them in __iter__.
+    Source order is preserved.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=_MAX_SIZE_PREFETCH_WORKERS) as executor:
+      pending = collections.deque()
+      source_iterator = iter(self._source_name_iterator)
+      source_iterator_error = None
+      while True:
+        while (source_iterator_error is None and
+               len(pending) < _MAX_OUTSTANDING_SIZE_LOOKUPS):
+          try:
+            source = next(source_iterator, None)
+          # pylint: disable=broad-except
+          except Exception as error:
+            # pylint: enable=broad-except
+            # Sources buffered in pending precede the failure point, so they
+            # must be yielded before the error surfaces or their copy tasks
+            # would be dropped silently.
+            source_iterator_error = error
+            break
+          if source is None:
+            break
+          if isinstance(source.resource,
+                        resource_reference.FileObjectResource):
+            size_future = executor.submit(
+                os.path.getsize, source.resource.storage_url.object_name)
+          else:
+            size_future = None
+          pending.append((source, size_future))
+        if not pending:
+          break
+        yield pending.popleft()
+      if source_iterator_error is not None:
+        raise source_iterator_error
 
+  def __iter__(self):
+    # Bind loop invariants to locals: this loop runs once per copied file,
+    # and each dotted lookup below would otherwise repeat on every pass.
+    custom_md5_digest = self._custom_md5_digest
+    task_status_queue = self._task_status_queue
+    do_not_decompress = self._do_not_decompress
+    user_request_args = self._user_request_args
+    print_status = log.status.Print
+    get_copy_task = copy_task_factory.get_copy_task
+
+    if task_status_queue:
+      source_and_size_iterator = self._iter_sources_with_prefetched_sizes()
+    else:
+      source_and_size_iterator = (
+          (source, None) for source in self._source_name_iterator)
+    # At debug verbosity, users are tracing per-file behavior, so lines must
+    # appear immediately rather than batched.
+    batch_status_messages = log.GetVerbosity() > logging.DEBUG
+    status_message_buffer = []
+    last_status_flush_time = time.monotonic()
+    for source, size_future in source_and_size_iterator:
+      source_resource = source.resource
       destination_resource = self._get_copy_destination(self._raw_destination,
                                                         source)
 
-      source_url = source.resource.storage_url
+      source_url = source_resource.storage_url
       destination_url = destination_resource.storage_url
-      if (isinstance(source.resource, resource_reference.ObjectResource) and
+      # versionless_url_string is rebuilt on each access, so capture it once
+      # per URL for the several reads below.
+      versionless_source_string = source_url.versionless_url_string
+      versionless_destination_string = destination_url.versionless_url_string
+      if (isinstance(source_resource, resource_reference.ObjectResource) and
           isinstance(destination_url, storage_url.FileUrl) and
           destination_url.object_name.endswith(destination_url.delimiter)):
         log.debug('Skipping downloading {} to {} since the destination ends in'
                   ' a file system delimiter.'.format(
-                      source_url.versionless_url_string,
-                      destination_url.versionless_url_string))
+                      versionless_source_string,
+                      versionless_destination_string))
         continue
 
-      if source_url != source.expanded_url and not self._multiple_sources:
+      if (source_url != source.expanded_url and
+          not self._destination_validated_for_recursion):
         # Multiple sources have been already validated in __init__.
         # This check is required for cases where recursion has been requested,
-        # but there is only one object that needs to be copied over.
+        # but there is only one object that needs to be copied over. The
+        # destination does not change mid-iteration, so one check suffices.
         self._raise_if_destination_is_file_url_and_not_a_directory()
+        self._destination_validated_for_recursion = True
 
       if source.original_url.generation:
         source_url_string = source_url.url_string
       else:
-        source_url_string = source_url.versionless_url_string
-
-      if self._custom_md5_digest:
-        source.resource.md5_hash = self._custom_md5_digest
-
-      log.status.Print('Copying {} to {}'.format(
-          source_url_string, destination_url.versionless_url_string))
-      if self._task_status_queue:
-        self._update_workload_estimation(source.resource)
-
-      yield copy_task_factory.get_copy_task(
-          source.resource,
+        source_url_string = versionless_source_string
+
+      if custom_md5_digest:
+        source_resource.md5_hash = custom_md5_digest
+
+      # Batching status messages trades a short display delay for one stderr
+      # write per batch rather than per file. Tasks yielded here only run
+      # later under the executor, so the lines still precede their copies.
+      status_message = 'Copying {} to {}'.format(
+          source_url_string, versionless_destination_string)
+      if not batch_status_messages:
+        print_status(status_message)
+      else:
+        status_message_buffer.append(status_message)
+        current_time = time.monotonic()
+        if (len(status_message_buffer) >= _STATUS_MESSAGE_BATCH_SIZE or
+            current_time - last_status_flush_time >=
+            _STATUS_MESSAGE_FLUSH_INTERVAL_SECONDS):
+          print_status('\n'.join(status_message_buffer))
+          del status_message_buffer[:]
+          last_status_flush_time = current_time
+      if task_status_queue:
+        self._update_workload_estimation(source_resource, size_future)
+
+      yield get_copy_task(
+          source_resource,
           destination_resource,
-          do_not_decompress=self._do_not_decompress,
-          user_request_args=self._user_request_args)
+          do_not_decompress=do_not_decompress,
+          user_request_args=user_request_args)
+
+    if status_message_buffer:
+      print_status('\n'.join(status_message_buffer))
 
     if (self._task_status_queue and
         (self._total_file_count > 0 or self._total_size > 0)):
@@ -286,7 +442,7 @@ class CopyTaskIterator:
   def _get_copy_destination(self, raw_destination, source):
     """Returns the final destination StorageUrl instance."""
     completion_is_necessary = (
-        _destination_is_container(raw_destination) or
+        self._raw_destination_is_container or
         self._multiple_sources or
         source.resource.storage_url != source.expanded_url  # Recursion case.
     )
@@ -356,32 +512,49 @@ class CopyTaskIterator:
     Returns:
       (str) The suffix to be appended to the destination container.
     """
-    source_prefix_to_ignore = storage_url.rstrip_one_delimiter(
-        source.expanded_url.versionless_url_string,
-        source.expanded_url.delimiter)
-
-    if (not isinstance(destination_container,
-                       resource_reference.UnknownResource) and
-        _has_valid_parent_dir(source.expanded_url) and
-        destination_container.is_container()):
-      # Destination container exists. This means we need to preserve the
-      # top-level source directory.
-      # Remove the leaf name so that it gets added to the destination.
-      source_prefix_to_ignore, _, _ = source_prefix_to_ignore.rpartition(
-          source.expanded_url.delimiter)
-      if not source_prefix_to_ignore:
-        # In case of Windows, the source URL might not contain any Windows
-        # delimiter if it was a single directory (e.g file://dir) and
-        # source_prefix_to_ignore will be empty. Set it to <scheme>://.
-        # TODO(b/169093672) This will not be required if we get rid of file://
-        source_prefix_to_ignore = source.expanded_url.scheme.value + '://'
-
-    full_source_url = source.resource.storage_url.versionless_url_string
-    suffix_for_destination = full_source_url.split(source_prefix_to_ignore)[1]
+    expanded_url = source.expanded_url
+    source_prefix_to_ignore = self._source_prefix_to_ignore_cache.get(
+        expanded_url)
+    if source_prefix_to_ignore is None:
+      expanded_delimiter = expanded_url.delimiter
+      source_prefix_to_ignore = storage_url.rstrip_one_delimiter(
+          expanded_url.versionless_url_string, expanded_delimiter)
+
+      if (not isinstance(destination_container,
+                         resource_reference.UnknownResource) and
+          _has_valid_parent_dir(expanded_url) and
+          destination_container.is_container()):
+        # Destination container exists. This means we need to preserve the
+        # top-level source directory.
+        # Remove the leaf name so that it gets added to the destination.
+        source_prefix_to_ignore, _, _ = source_prefix_to_ignore.rpartition(
+            expanded_delimiter)
+        if not source_prefix_to_ignore:
+          # In case of Windows, the source URL might not contain any Windows
+          # delimiter if it was a single directory (e.g file://dir) and
+          # source_prefix_to_ignore will be empty. Set it to <scheme>://.
+          # TODO(b/169093672) This will not be required if we get rid of
+          # file://
+          source_prefix_to_ignore = expanded_url.scheme.value + '://'
+      self._source_prefix_to_ignore_cache[expanded_url] = (
+          source_prefix_to_ignore)
+
+    source_url = source.resource.storage_url
+    full_source_url = source_url.versionless_url_string
+    if full_source_url.startswith(source_prefix_to_ignore):
+      # Slicing off the known prefix avoids split's scan of the whole string
+      # and the list it allocates.
+      suffix_for_destination = full_source_url[len(source_prefix_to_ignore):]
+    else:
+      suffix_for_destination = full_source_url.split(source_prefix_to_ignore)[1]
+
+    if _PLATFORM_USES_POSIX_DELIMITERS:
+      # Every URL type already delimits with '/'.
+      return suffix_for_destination
 
     # Windows uses \ as a delimiter. Force the suffix to use the same
     # delimiter used by the destination container.
-    source_delimiter = source.resource.storage_url.delimiter
+    source_delimiter = source_url.delimiter
     destination_delimiter = destination_container.storage_url.delimiter
     if source_delimiter != destination_delimiter:
       return suffix_for_destination.replace(source_delimiter,
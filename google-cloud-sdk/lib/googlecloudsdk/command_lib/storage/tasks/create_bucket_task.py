@@ -14,10 +14,6 @@
 # limitations under the License.
 """Task for creating a bucket."""
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import unicode_literals
-
 from googlecloudsdk.api_lib.storage import api_factory
 from googlecloudsdk.command_lib.storage.tasks import task
 
@@ -68,6 +68,13 @@ else:
 
 _TASK_QUEUE_LOCK = threading.Lock()
 
+# Whether queue.get needs the lock above is fixed by the interpreter version
+# and start method, so compute it once instead of on every task dispatch.
+_TASK_QUEUE_GET_IS_UNSAFE = (
+    sys.version_info.major == 3 and sys.version_info.minor <= 5
+    and multiprocessing_context.get_start_method() == 'spawn'
+)
+
 
 @contextlib.contextmanager
 def _task_queue_lock():
@@ -87,17 +94,12 @@ def _task_queue_lock():
   Yields:
     None, but acquires a lock which is released on exit.
   """
-  get_is_unsafe = (
-      sys.version_info.major == 3 and sys.version_info.minor <= 5
-      and multiprocessing_context.get_start_method() == 'spawn'
-  )
-
   try:
-    if get_is_unsafe:
+    if _TASK_QUEUE_GET_IS_UNSAFE:
       _TASK_QUEUE_LOCK.acquire()
     yield
   finally:
-    if get_is_unsafe:
+    if _TASK_QUEUE_GET_IS_UNSAFE:
       _TASK_QUEUE_LOCK.release()
 
 
@@ -350,12 +352,12 @@ class TaskGraphExecutor:
     and adding them to self._executable_tasks.
     """
 
-    while True:
-      try:
-        task_object = next(self._task_iterator)
-      except StopIteration:
-        break
-      task_wrapper = self._task_graph.add(task_object)
+    # These methods run once per task, so bind them outside the loop.
+    add_to_graph = self._task_graph.add
+    put_executable_task = self._executable_tasks.put
+
+    for task_object in self._task_iterator:
+      task_wrapper = add_to_graph(task_object)
       if task_wrapper is None:
         # self._task_graph rejected the task.
         continue
@@ -363,19 +365,23 @@ class TaskGraphExecutor:
       # Tasks from task_iterator should have a lower priority than tasks that
       # are spawned by other tasks. This helps keep memory usage under control
       # when a workload's task graph has a large branching factor.
-      self._executable_tasks.put(task_wrapper, prioritize=False)
+      put_executable_task(task_wrapper, prioritize=False)
 
   @_store_exception
   def _add_executable_tasks_to_queue(self):
     """Sends executable tasks to consumer threads in child processes."""
     task_wrapper = None
+    # The process count only grows, so once the limit is hit the check below
+    # never needs to run again.
+    reached_process_limit = False
     while True:
       if task_wrapper is None:
         task_wrapper = self._executable_tasks.get()
         if task_wrapper == _SHUTDOWN:
           break
 
-      reached_process_limit = self._process_count >= self._max_process_count
+      if not reached_process_limit:
+        reached_process_limit = self._process_count >= self._max_process_count
 
       try:
         self._task_queue.put(task_wrapper, block=reached_process_limit)
@@ -390,8 +396,14 @@ class TaskGraphExecutor:
   @_store_exception
   def _handle_task_output(self):
     """Updates a dependency graph based on information from executed tasks."""
+    # These methods run once per completed task, so bind them outside the
+    # loop.
+    get_output = self._task_output_queue.get
+    update_from_executed_task = self._task_graph.update_from_executed_task
+    put_executable_task = self._executable_tasks.put
+
     while True:
-      output = self._task_output_queue.get()
+      output = get_output()
       if output == _SHUTDOWN:
         break
 
@@ -400,12 +412,12 @@ class TaskGraphExecutor:
         for message in task_output.messages:
           if message.topic == task.Topic.FATAL_ERROR:
             self._exit_code = 1
-      submittable_tasks = self._task_graph.update_from_executed_task(
-          executed_task_wrapper, task_output)
+      submittable_tasks = update_from_executed_task(executed_task_wrapper,
+                                                    task_output)
 
       for task_wrapper in submittable_tasks:
         task_wrapper.is_submitted = True
-        self._executable_tasks.put(task_wrapper)
+        put_executable_task(task_wrapper)
 
   def run(self):
     """Executes tasks from a task iterator in parallel.
@@ -19,6 +19,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
 from collections import OrderedDict
 import re
 
@@ -32,6 +33,12 @@ from googlecloudsdk.core.util import http_encoding
 
 import six
 
+try:
+  # Python 3.3 and above.
+  collections_abc = collections.abc
+except AttributeError:
+  collections_abc = collections
+
 # Used to determine if a value has been set for an argument
 UNSPECIFIED = object()
 
@@ -766,7 +773,9 @@ class ChoiceEnumMapper(object):
         for mapped values.
     """
     if self._custom_mappings:  # Process Custom Mappings
-      if not isinstance(self._custom_mappings, dict):
+      # Mapping rather than dict so read-only views (types.MappingProxyType)
+      # of shared mapping constants are accepted too.
+      if not isinstance(self._custom_mappings, collections_abc.Mapping):
         raise TypeError(
             self._CUSTOM_MAPPING_ERROR.format(self._custom_mappings))
       enum_strings = set([x.name for x in self._enum])
@@ -54,6 +54,19 @@ X_POW_2K_TABLE = [
     2102628683, 1033187991, 4243778976, 1123580069
 ]
 
+# Template Crc instance for the crcmod fallback, created on first use.
+# Instantiating predefined.Crc generates a 256-entry lookup table, so new
+# digesters are cloned from this template instead of regenerating it.
+_crcmod_template = None
+
+
+def _get_crcmod_crc32c():
+  """Returns a crcmod CRC32C digester without rebuilding its table."""
+  global _crcmod_template
+  if _crcmod_template is None:
+    _crcmod_template = crcmod.predefined.Crc('crc-32c')
+  return _crcmod_template.new()
+
 
 def get_crc32c(initial_data=b''):
   """Returns an instance of Hashlib-like helper for CRC32C operations.
@@ -82,7 +95,7 @@ def get_crc32c(initial_data=b''):
   if IS_FAST_GOOGLE_CRC32C_AVAILABLE:
     crc = google_crc32c.Checksum()
   else:
-    crc = crcmod.predefined.Crc('crc-32c')
+    crc = _get_crcmod_crc32c()
 
   if initial_data:
     crc.update(initial_data)